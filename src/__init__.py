@@ -1 +1,3 @@
 """Mastermind LLM Benchmark - A tool for benchmarking LLM logical deduction capabilities."""
+
+__version__ = "0.1.0"
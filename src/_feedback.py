@@ -0,0 +1,171 @@
+"""Native-speed feedback kernels for solver-style batch scoring.
+
+The per-turn game loop does not need these, but a solver that scores a
+guess against the full candidate set (num_colors ** num_pegs codes) calls
+feedback millions of times, where Python-level overhead dominates. The
+kernels here operate on small integer arrays and are compiled with numba
+when it is installed; without numba they still run as plain Python over
+NumPy arrays. NumPy itself is required only for the batch API.
+"""
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op decorator fallback when numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+if NUMPY_AVAILABLE:
+
+    @njit(cache=True, fastmath=False)
+    def feedback_kernel(guess, secret, counts_buf):
+        """
+        Score one guess against one secret.
+
+        Args:
+            guess: int8 array of length num_pegs
+            secret: int8 array of length num_pegs
+            counts_buf: int32 scratch array of length num_colors
+
+        Returns:
+            (black, white) tuple
+        """
+        counts_buf[:] = 0
+        black = 0
+        for i in range(secret.shape[0]):
+            if guess[i] == secret[i]:
+                black += 1
+            else:
+                counts_buf[secret[i]] += 1
+
+        white = 0
+        for i in range(guess.shape[0]):
+            if guess[i] != secret[i] and counts_buf[guess[i]] > 0:
+                counts_buf[guess[i]] -= 1
+                white += 1
+
+        return black, white
+
+    @njit(cache=True, parallel=True)
+    def batch_feedback_kernel(guesses, secret, num_colors, out):
+        """Score a (N, num_pegs) array of guesses; writes (N, 2) into out."""
+        for n in prange(guesses.shape[0]):
+            counts = np.zeros(num_colors, dtype=np.int32)
+            black = 0
+            for i in range(secret.shape[0]):
+                if guesses[n, i] == secret[i]:
+                    black += 1
+                else:
+                    counts[secret[i]] += 1
+
+            white = 0
+            for i in range(secret.shape[0]):
+                if guesses[n, i] != secret[i] and counts[guesses[n, i]] > 0:
+                    counts[guesses[n, i]] -= 1
+                    white += 1
+
+            out[n, 0] = black
+            out[n, 1] = white
+
+
+# --- SWAR packed-code scoring -------------------------------------------
+#
+# For num_pegs <= 16 and num_colors <= 16 a whole code fits in one 64-bit
+# word as 4-bit nibbles, and a per-color histogram fits in 8-bit byte
+# lanes. Equality and per-lane minimum then become a handful of bitwise
+# operations instead of Python list scans, which lets a solver score a
+# candidate with two ints and a popcount.
+
+_NIBBLE_LSB = 0x1111111111111111
+
+MAX_PACKED_PEGS = 16
+MAX_PACKED_COLORS = 16
+
+
+def pack_code(code: list[int]) -> int:
+    """Pack a code (num_pegs <= 16, colors <= 16) into 4-bit nibbles."""
+    packed = 0
+    for i, color in enumerate(code):
+        packed |= color << (4 * i)
+    return packed
+
+
+def color_histogram(code: list[int]) -> int:
+    """Pack per-color counts of a code into 8-bit byte lanes."""
+    hist = 0
+    for color in code:
+        hist += 1 << (8 * color)
+    return hist
+
+
+def swar_black(a: int, b: int, num_pegs: int) -> int:
+    """Count equal nibbles (black pegs) between two packed codes."""
+    x = a ^ b
+    # Collapse each nibble to its low bit: 1 where the nibbles differ
+    x = (x | (x >> 1) | (x >> 2) | (x >> 3)) & _NIBBLE_LSB
+    return num_pegs - x.bit_count()
+
+
+def _min_bytes(x: int, y: int, num_colors: int) -> int:
+    """Per-byte-lane minimum of two packed histograms."""
+    full = (1 << (8 * num_colors)) - 1
+    high = int.from_bytes(b'\x80' * num_colors, 'little')
+    # Setting the guard bit prevents borrows from crossing lanes, and the
+    # guard survives the subtraction exactly when x_lane >= y_lane
+    ge = ((x | high) - y) & high
+    mask = (ge >> 7) * 0xFF
+    return (y & mask) | (x & (mask ^ full))
+
+
+def packed_feedback(a: int, b: int, a_hist: int, b_hist: int,
+                    num_pegs: int, num_colors: int) -> tuple[int, int]:
+    """
+    Score two packed codes (see pack_code/color_histogram).
+
+    Returns:
+        (black, white) tuple
+    """
+    black = swar_black(a, b, num_pegs)
+    min_counts = _min_bytes(a_hist, b_hist, num_colors)
+    total = 0
+    for c in range(num_colors):
+        total += (min_counts >> (8 * c)) & 0xFF
+    return black, total - black
+
+
+def batch_feedback(guesses, secret, num_colors):
+    """
+    Score many candidate guesses against one secret.
+
+    Args:
+        guesses: (N, num_pegs) array-like of candidate codes
+        secret: length num_pegs array-like
+        num_colors: number of colors in the game
+
+    Returns:
+        (N, 2) int32 ndarray of (black, white) pairs
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("batch_feedback requires numpy to be installed")
+
+    guesses_arr = np.ascontiguousarray(guesses, dtype=np.int8)
+    secret_arr = np.ascontiguousarray(secret, dtype=np.int8)
+    out = np.empty((guesses_arr.shape[0], 2), dtype=np.int32)
+    batch_feedback_kernel(guesses_arr, secret_arr, num_colors, out)
+    return out
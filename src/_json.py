@@ -0,0 +1,166 @@
+"""Fast JSON helpers shared by the player backends.
+
+Uses orjson when available (2-3x faster than stdlib on the small payloads
+we parse per turn) and falls back to the stdlib json module otherwise.
+Both raise ValueError subclasses on malformed input, so callers can catch
+ValueError regardless of backend.
+
+When pysimdjson is installed, the guess/response extractors additionally
+use its lazy DOM: the parser locates structural characters with SIMD in
+one pass and only the requested pointer is materialized as Python
+objects, which is a large win on long explanation-plus-JSON responses.
+"""
+
+import json
+import threading
+
+try:
+    import orjson
+
+    def loads(s):
+        """Parse a JSON string or bytes into Python objects."""
+        return orjson.loads(s)
+
+    def dumps(obj) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    def dumps_bytes(obj) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes (no str round-trip)."""
+        return orjson.dumps(obj)
+
+    def dumps_indented(obj) -> bytes:
+        """Serialize obj to 2-space-indented UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    def loads(s):
+        """Parse a JSON string or bytes into Python objects."""
+        return json.loads(s)
+
+    def dumps(obj) -> str:
+        """Serialize obj to a JSON string."""
+        return json.dumps(obj)
+
+    def dumps_bytes(obj) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes (no str round-trip)."""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+    def dumps_indented(obj) -> bytes:
+        """Serialize obj to 2-space-indented UTF-8 JSON bytes."""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+
+if SIMDJSON_AVAILABLE:
+
+    # Parser instances are not thread-safe and each parse() invalidates
+    # the previous document, so concurrent games (--concurrency) sharing
+    # one instance could silently read each other's documents. One
+    # parser per thread keeps the buffer-reuse win without the hazard.
+    _SIMD_LOCAL = threading.local()
+
+    def _simd_parser():
+        """Return this thread's simdjson parser, creating it on first use."""
+        parser = getattr(_SIMD_LOCAL, 'parser', None)
+        if parser is None:
+            parser = _SIMD_LOCAL.parser = simdjson.Parser()
+        return parser
+
+    def extract_guess(s):
+        """Return the top-level "guess" list from a JSON object, or None."""
+        try:
+            doc = _simd_parser().parse(s.encode() if isinstance(s, str) else s)
+            guess = doc.at_pointer("/guess")
+        except (ValueError, KeyError, TypeError):
+            return None
+        if isinstance(guess, simdjson.Array):
+            return guess.as_list()
+        return guess if isinstance(guess, list) else None
+
+    def extract_wrapped_response(s):
+        """Return the "response" string from a wrapper object, or None."""
+        try:
+            doc = _simd_parser().parse(s.encode() if isinstance(s, str) else s)
+            inner = doc.at_pointer("/response")
+        except (ValueError, KeyError, TypeError):
+            return None
+        return inner if isinstance(inner, str) else None
+
+    def extract_guess_or_wrapped(s):
+        """Return (guess, inner_response) from one parse of a JSON object.
+
+        At most one of the two is non-None: the guess wins if both keys
+        are somehow present. Parsing the document once covers both the
+        plain {"guess": [...]} shape and the Gemini CLI wrapper without
+        a second decode.
+        """
+        try:
+            doc = _simd_parser().parse(s.encode() if isinstance(s, str) else s)
+        except (ValueError, TypeError):
+            return None, None
+        try:
+            guess = doc.at_pointer("/guess")
+        except (ValueError, KeyError, TypeError):
+            guess = None
+        if isinstance(guess, simdjson.Array):
+            return guess.as_list(), None
+        if isinstance(guess, list):
+            return guess, None
+        try:
+            inner = doc.at_pointer("/response")
+        except (ValueError, KeyError, TypeError):
+            inner = None
+        return None, inner if isinstance(inner, str) else None
+
+else:
+
+    def extract_guess(s):
+        """Return the top-level "guess" list from a JSON object, or None."""
+        try:
+            data = loads(s)
+        except ValueError:
+            return None
+        if isinstance(data, dict):
+            guess = data.get("guess")
+            if isinstance(guess, list):
+                return guess
+        return None
+
+    def extract_wrapped_response(s):
+        """Return the "response" string from a wrapper object, or None."""
+        try:
+            data = loads(s)
+        except ValueError:
+            return None
+        if isinstance(data, dict):
+            inner = data.get("response")
+            if isinstance(inner, str):
+                return inner
+        return None
+
+    def extract_guess_or_wrapped(s):
+        """Return (guess, inner_response) from one parse of a JSON object.
+
+        At most one of the two is non-None: the guess wins if both keys
+        are somehow present. Parsing the document once covers both the
+        plain {"guess": [...]} shape and the Gemini CLI wrapper without
+        a second decode.
+        """
+        try:
+            data = loads(s)
+        except ValueError:
+            return None, None
+        if not isinstance(data, dict):
+            return None, None
+        guess = data.get("guess")
+        if isinstance(guess, list):
+            return guess, None
+        inner = data.get("response")
+        return None, inner if isinstance(inner, str) else None
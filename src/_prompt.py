@@ -0,0 +1,126 @@
+"""Shared prompt construction and response parsing for player backends.
+
+The CLI, API, and clipboard players all explain the same rules and accept
+the same response shapes, so the canonical system prompt and the guess
+parser live here: one compiled-regex/JSON toolchain serves every backend
+instead of three near-identical copies.
+"""
+
+import re
+from typing import Optional
+
+from . import _json
+from .game import GameConfig
+
+# Compiled once so every parse reuses the same pattern objects
+_CODE_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_GUESS_OBJ_RE = re.compile(r'\{\s*"guess"\s*:\s*\[[\d,\s]+\]\s*\}')
+
+
+def build_system_prompt(game_config: GameConfig) -> str:
+    """Build the system prompt for a game configuration."""
+    duplicates_text = (
+        "Duplicate colors are allowed."
+        if game_config.allow_duplicates
+        else "All colors must be unique."
+    )
+
+    turns_text = (
+        "You have unlimited guesses."
+        if game_config.max_turns is None
+        else f"You have a maximum of {game_config.max_turns} guesses."
+    )
+
+    return f"""You are playing Mastermind.
+
+RULES:
+- The secret code has {game_config.num_pegs} positions
+- Each position contains a color numbered from 0 to {game_config.num_colors - 1}
+- {duplicates_text}
+- {turns_text}
+
+FEEDBACK:
+- Black pegs: correct color in correct position
+- White pegs: correct color in wrong position
+- You are NOT told which positions are correct
+
+RESPONSE FORMAT:
+Respond with ONLY a JSON object containing your guess.
+{{"guess": [{', '.join(str(i) for i in range(game_config.num_pegs))}]}}
+
+Do not include any other text or explanation outside the JSON object."""
+
+
+def _coerce_guess(guess, game_config: Optional[GameConfig]) -> Optional[list[int]]:
+    """Validate and coerce an extracted guess in a single pass.
+
+    Returns a list of in-range ints, or None if the guess is malformed.
+    Without a game_config only the shape (a list) is checked.
+    """
+    if game_config is None:
+        return guess
+    if len(guess) != game_config.num_pegs:
+        return None
+    try:
+        num_colors = game_config.num_colors
+        out = []
+        for x in guess:
+            x = int(x)
+            if not 0 <= x < num_colors:
+                return None
+            out.append(x)
+    except (TypeError, ValueError):
+        return None
+    return out
+
+
+def parse_guess(response: str, game_config: Optional[GameConfig] = None) -> Optional[list[int]]:
+    """Extract a guess list from an LLM response.
+
+    Tries, in order: the Gemini CLI response wrapper, a direct JSON parse,
+    a markdown code fence, and the last bare {"guess": [...]} object.
+    When a game_config is given, length and color bounds are checked while
+    coercing values to int, so callers get an already-validated guess.
+    Returns None when no valid guess can be extracted.
+    """
+    response = response.strip() if response else ""
+
+    # Fast pre-scan: a response that never mentions a guess can't parse,
+    # so skip the JSON machinery entirely. (Checked without quotes since
+    # the Gemini wrapper escapes the inner JSON.)
+    if not response or 'guess' not in response:
+        return None
+
+    # Strategy 1: Direct JSON parse, handling the Gemini CLI wrapper
+    # ({"response": "...", "stats": {...}}) from the same decode. Only
+    # worth attempting when the response looks like a bare JSON object;
+    # prose-plus-JSON responses always fail here, so route them straight
+    # to the extractors.
+    if response[0] == '{':
+        guess, inner = _json.extract_guess_or_wrapped(response)
+        if guess is not None:
+            return _coerce_guess(guess, game_config)
+        if inner is not None:
+            # Unwrapped Gemini content: one more parse on the inner text
+            response = inner.strip()
+            if response and response[0] == '{':
+                guess = _json.extract_guess(response)
+                if guess is not None:
+                    return _coerce_guess(guess, game_config)
+
+    # Strategy 2: Try to extract JSON from markdown code blocks
+    json_match = _CODE_FENCE_RE.search(response)
+    if json_match:
+        guess = _json.extract_guess(json_match.group(1))
+        if guess is not None:
+            return _coerce_guess(guess, game_config)
+
+    # Strategy 3: Try to find last JSON object in response (without code fence)
+    # Look for patterns like {"guess": [1, 2, 3, 4]} at the end
+    matches = list(_GUESS_OBJ_RE.finditer(response))
+    if matches:
+        guess = _json.extract_guess(matches[-1].group(0))
+        if guess is not None:
+            return _coerce_guess(guess, game_config)
+
+    return None
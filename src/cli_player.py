@@ -1,12 +1,40 @@
 """CLI interface for local LLM tools (Claude Code, Codex, Gemini)."""
 
+import asyncio
+import functools
 import subprocess
 from dataclasses import dataclass
 from typing import Optional
 
+from . import _json, _prompt
 from .game import GameConfig
 
 
+@functools.lru_cache(maxsize=None)
+def _schema_for(num_pegs: int, strict: bool) -> str:
+    """Serialized JSON schema for guess validation, cached per shape.
+
+    Keyed on the strict flag as well as num_pegs, since strict mode adds
+    additionalProperties to the schema.
+    """
+    schema = {
+        "type": "object",
+        "properties": {
+            "guess": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "minItems": num_pegs,
+                "maxItems": num_pegs
+            }
+        },
+        "required": ["guess"]
+    }
+    # Test L: Add strict validation
+    if strict:
+        schema["additionalProperties"] = False
+    return _json.dumps(schema)
+
+
 class CLIError(Exception):
     """Base exception for CLI-related issues."""
     pass
@@ -51,7 +79,17 @@ class CLIPlayer:
         """
         self.game_config = game_config
         self.cli_config = cli_config
-        self.system_prompt = self._build_system_prompt()
+        self.system_prompt = _prompt.build_system_prompt(game_config)
+        # Schema only depends on config, so it is built and serialized once
+        # per (num_pegs, strict) shape and shared across player instances
+        self._schema_json = _schema_for(game_config.num_pegs, cli_config.strict_schema)
+        # The prompt frame around the history is fixed per player
+        self._system_prefix = f"System: {self.system_prompt}\n"
+        # Rendered history, grown turn by turn so each prompt build is
+        # O(new turns) instead of re-rendering the whole game. A bytearray
+        # grows in place, avoiding the intermediate copies str += makes.
+        self._history_buf = bytearray()
+        self._rendered_turns = 0
 
     def get_next_guess(self, game_history: list[dict], retry_count: int = 0) -> dict:
         """
@@ -93,96 +131,50 @@ class CLIPlayer:
                 "tokens": {"input": 0, "output": 0}
             }
 
-    def _build_system_prompt(self) -> str:
-        """Build system prompt based on game configuration."""
-        duplicates_text = (
-            "Duplicate colors are allowed."
-            if self.game_config.allow_duplicates
-            else "All colors must be unique."
-        )
-
-        turns_text = (
-            f"You have a maximum of {self.game_config.max_turns} guesses."
-            if self.game_config.max_turns
-            else "You have unlimited guesses."
-        )
-
-        return f"""You are playing Mastermind.
-
-RULES:
-- The secret code has {self.game_config.num_pegs} positions
-- Each position contains a color numbered from 0 to {self.game_config.num_colors - 1}
-- {duplicates_text}
-- {turns_text}
-
-FEEDBACK:
-- Black pegs: correct color in correct position
-- White pegs: correct color in wrong position
-- You are NOT told which positions are correct
-
-RESPONSE FORMAT:
-You MUST respond with a valid JSON object containing your guess.
-If you want to explain your reasoning, put the JSON object at the very end of your response.
-
-Required format:
-{{"guess": [{', '.join(str(i) for i in range(self.game_config.num_pegs))}]}}
-
-CRITICAL: The JSON must be valid and parseable. Wrap it in ```json code fences if including explanations."""
-
-    def _build_json_schema(self) -> str:
-        """Build JSON schema for structured output validation."""
-        import json
-        schema = {
-            "type": "object",
-            "properties": {
-                "guess": {
-                    "type": "array",
-                    "items": {"type": "integer"},
-                    "minItems": self.game_config.num_pegs,
-                    "maxItems": self.game_config.num_pegs
-                }
-            },
-            "required": ["guess"]
-        }
-        # Test L: Add strict validation
-        if self.cli_config.strict_schema:
-            schema["additionalProperties"] = False
-        return json.dumps(schema)
+    def _render_turn(self, turn_number: int, turn: dict) -> str:
+        """Render one history turn as prompt text."""
+        lines = [f"Turn {turn_number}:", f"Guess: {turn['guess']}"]
+        if turn.get('feedback'):
+            fb = turn['feedback']
+            lines.append(f"Feedback: {fb['black']} black, {fb['white']} white")
+        elif turn.get('error'):
+            lines.append(f"Error: {turn['error']}")
+        lines.append("")
+        return "\n".join(lines) + "\n"
 
     def _build_prompt(self, game_history: list[dict], retry_count: int) -> str:
-        """Build prompt text for CLI tool."""
-        parts = [f"System: {self.system_prompt}"]
+        """Build prompt text for CLI tool.
+
+        History is append-only, so previously rendered turns are cached and
+        only the new turns are rendered — O(new turns) per call instead of
+        O(total turns).
+        """
+        # New game with the same player instance: discard the stale cache
+        if len(game_history) < self._rendered_turns:
+            self._history_buf = bytearray()
+            self._rendered_turns = 0
+
+        for i in range(self._rendered_turns, len(game_history)):
+            self._history_buf += self._render_turn(i + 1, game_history[i]).encode()
+        self._rendered_turns = len(game_history)
 
-        # Build history
         if not game_history:
-            parts.append("Human: Make your first guess.")
+            body = "Human: Make your first guess."
         else:
-            parts.append("Human: Previous guesses:\n")
-            for i, turn in enumerate(game_history, 1):
-                parts.append(f"Turn {i}:")
-                parts.append(f"Guess: {turn['guess']}")
-                if turn.get('feedback'):
-                    fb = turn['feedback']
-                    parts.append(f"Feedback: {fb['black']} black, {fb['white']} white")
-                elif turn.get('error'):
-                    parts.append(f"Error: {turn['error']}")
-                parts.append("")
-
             if retry_count > 0:
-                parts.append("Your last guess was invalid. Please provide a valid guess in the correct JSON format.")
+                instruction = "Your last guess was invalid. Please provide a valid guess in the correct JSON format."
             else:
-                parts.append("Provide your next guess.")
+                instruction = "Provide your next guess."
+            body = f"Human: Previous guesses:\n\n{self._history_buf.decode()}{instruction}"
 
-        parts.append("\nAssistant:")
-
-        prompt = "\n".join(parts)
+        prompt = f"{self._system_prefix}{body}\n\nAssistant:"
         # Test K: Add prompt prefix (e.g., "Ultrathink. ")
         if self.cli_config.prompt_prefix:
             prompt = self.cli_config.prompt_prefix + prompt
         return prompt
 
-    def _call_cli(self, prompt: str) -> str:
-        """Call the CLI tool with the prompt."""
+    def _build_command(self, prompt: str) -> tuple[list[str], Optional[str]]:
+        """Build the CLI command line. Returns (cmd, stdin_input)."""
         cli_tool = self.cli_config.cli_tool
 
         # Build command with output format flags
@@ -195,8 +187,7 @@ CRITICAL: The JSON must be valid and parseable. Wrap it in ```json code fences i
 
             # JSON schema for constrained decoding
             if self.cli_config.use_json_schema:
-                schema = self._build_json_schema()
-                cmd.extend(['--json-schema', schema])
+                cmd.extend(['--json-schema', self._schema_json])
 
             # Model override (Test G: sonnet comparison)
             if self.cli_config.model_override:
@@ -223,20 +214,29 @@ CRITICAL: The JSON must be valid and parseable. Wrap it in ```json code fences i
         else:
             raise CLIError(f"Unknown CLI tool: {cli_tool}")
 
+        return cmd, stdin_input
+
+    def _call_cli(self, prompt: str) -> str:
+        """Call the CLI tool with the prompt."""
+        cli_tool = self.cli_config.cli_tool
+        cmd, stdin_input = self._build_command(prompt)
+
         try:
+            # Run in bytes mode: encode stdin once here and decode stdout
+            # only on success, skipping the TextIOWrapper layer and the
+            # stderr decode on the happy path
             result = subprocess.run(
                 cmd,
-                input=stdin_input,
+                input=stdin_input.encode() if stdin_input is not None else None,
                 capture_output=True,
-                text=True,
                 timeout=self.cli_config.timeout
             )
 
             if result.returncode != 0:
-                error_msg = result.stderr or "Unknown error"
+                error_msg = result.stderr.decode(errors='replace') or "Unknown error"
                 raise CLIError(f"{cli_tool} CLI error: {error_msg}")
 
-            return result.stdout.strip()
+            return result.stdout.decode(errors='replace').strip()
 
         except subprocess.TimeoutExpired:
             raise CLITimeoutError(f"{cli_tool} CLI timed out after {self.cli_config.timeout} seconds")
@@ -249,50 +249,65 @@ CRITICAL: The JSON must be valid and parseable. Wrap it in ```json code fences i
                 raise
             raise CLIError(f"Error calling {cli_tool}: {str(e)}")
 
-    def _parse_response(self, response: str) -> Optional[list[int]]:
-        """Extract guess from JSON response."""
-        import json
-        import re
+    async def _call_cli_async(self, prompt: str) -> str:
+        """Async variant of _call_cli; lets many CLI calls run concurrently."""
+        cli_tool = self.cli_config.cli_tool
+        cmd, stdin_input = self._build_command(prompt)
 
-        # Gemini CLI wraps responses in {"response": "...", "stats": {...}}
-        # Extract the actual response content first
         try:
-            wrapper = json.loads(response.strip())
-            if "response" in wrapper and isinstance(wrapper["response"], str):
-                response = wrapper["response"]
-        except json.JSONDecodeError:
-            pass
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE if stdin_input is not None else None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except FileNotFoundError:
+            raise CLINotFoundError(
+                f"{cli_tool} CLI not found. Please ensure '{cli_tool}' is installed and in PATH"
+            )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(stdin_input.encode() if stdin_input is not None else None),
+                timeout=self.cli_config.timeout
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise CLITimeoutError(f"{cli_tool} CLI timed out after {self.cli_config.timeout} seconds")
+        except Exception as e:
+            raise CLIError(f"Error calling {cli_tool}: {str(e)}")
+
+        if proc.returncode != 0:
+            error_msg = stderr.decode(errors='replace') or "Unknown error"
+            raise CLIError(f"{cli_tool} CLI error: {error_msg}")
 
-        # Strategy 1: Try direct JSON parse
+        return stdout.decode(errors='replace').strip()
+
+    async def get_next_guess_async(self, game_history: list[dict], retry_count: int = 0) -> dict:
+        """Async variant of get_next_guess for concurrent benchmark drivers."""
         try:
-            data = json.loads(response.strip())
-            if "guess" in data and isinstance(data["guess"], list):
-                return data["guess"]
-        except json.JSONDecodeError:
-            pass
-
-        # Strategy 2: Try to extract JSON from markdown code blocks
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response, re.DOTALL)
-        if json_match:
-            try:
-                data = json.loads(json_match.group(1))
-                if "guess" in data and isinstance(data["guess"], list):
-                    return data["guess"]
-            except json.JSONDecodeError:
-                pass
-
-        # Strategy 3: Try to find last JSON object in response (without code fence)
-        # Look for patterns like {"guess": [1, 2, 3, 4]} at the end
-        json_pattern = r'\{\s*"guess"\s*:\s*\[[\d,\s]+\]\s*\}'
-        matches = list(re.finditer(json_pattern, response))
-        if matches:
-            # Try parsing the last match
-            last_match = matches[-1]
-            try:
-                data = json.loads(last_match.group(0))
-                if "guess" in data and isinstance(data["guess"], list):
-                    return data["guess"]
-            except json.JSONDecodeError:
-                pass
-
-        return None
+            prompt = self._build_prompt(game_history, retry_count)
+            response = await self._call_cli_async(prompt)
+            guess = self._parse_response(response)
+
+            return {
+                "guess": guess,
+                "raw_response": response,
+                "parsed": guess is not None,
+                "error": None if guess is not None else "Failed to parse response",
+                "tokens": {"input": 0, "output": 0}
+            }
+
+        except Exception as e:
+            return {
+                "guess": None,
+                "raw_response": "",
+                "parsed": False,
+                "error": str(e),
+                "tokens": {"input": 0, "output": 0}
+            }
+
+    def _parse_response(self, response: str) -> Optional[list[int]]:
+        """Extract guess from JSON response."""
+        return _prompt.parse_guess(response, self.game_config)
@@ -1,12 +1,14 @@
 """Manual input mode using clipboard for web UI interaction."""
 
 from typing import Optional
-import pyperclip
-import json
-import re
 
+from . import _prompt
 from .game import GameConfig
 
+# Clipboard round-trips shell out to xclip/pbcopy; skip the copy for
+# prompts past this size and just print them
+_MAX_CLIPBOARD_CHARS = 100_000
+
 
 class ClipboardPlayer:
     """Player that uses manual input with clipboard assistance for web UIs."""
@@ -21,7 +23,19 @@ class ClipboardPlayer:
         """
         self.game_config = game_config
         self.model_label = model_label
-        self.system_prompt = self._build_system_prompt()
+        self.system_prompt = _prompt.build_system_prompt(game_config)
+        # Imported lazily so the other player modes never pay for the
+        # pyperclip import (or its clipboard-backend probe)
+        try:
+            import pyperclip
+            self._pyperclip = pyperclip
+        except ImportError:
+            self._pyperclip = None
+        # Rendered history, grown turn by turn so each prompt build is
+        # O(new turns) instead of re-rendering the whole game. A bytearray
+        # grows in place, avoiding the intermediate copies str += makes.
+        self._history_buf = bytearray()
+        self._rendered_turns = 0
 
     def get_next_guess(self, game_history: list[dict], retry_count: int = 0) -> dict:
         """Get guess via manual input with clipboard assistance."""
@@ -29,12 +43,19 @@ class ClipboardPlayer:
         # Build prompt
         prompt = self._build_prompt(game_history, retry_count)
 
-        # Copy to clipboard
-        pyperclip.copy(prompt)
+        # Copy to clipboard (skipped when unavailable or the prompt is
+        # too large for a reasonable clipboard round-trip)
+        copied = False
+        if self._pyperclip is not None and len(prompt) <= _MAX_CLIPBOARD_CHARS:
+            try:
+                self._pyperclip.copy(prompt)
+                copied = True
+            except Exception:
+                pass
 
         # Display to user
         print("\n" + "=" * 70)
-        print("PROMPT COPIED TO CLIPBOARD")
+        print("PROMPT COPIED TO CLIPBOARD" if copied else "PROMPT (clipboard unavailable)")
         print("=" * 70)
         print(prompt)
         print("=" * 70)
@@ -53,7 +74,7 @@ class ClipboardPlayer:
         # If user just pressed enter, try to paste from clipboard
         if not user_input:
             try:
-                user_input = pyperclip.paste()
+                user_input = self._pyperclip.paste()
                 print(f"\nPasted from clipboard:\n{user_input[:200]}...\n")
             except Exception:
                 print("Could not paste from clipboard. Please type the response.")
@@ -71,80 +92,42 @@ class ClipboardPlayer:
             "prompt_shown": prompt
         }
 
-    def _build_system_prompt(self) -> str:
-        """Build system prompt based on game configuration."""
-        duplicates_text = (
-            "Duplicate colors are allowed."
-            if self.game_config.allow_duplicates
-            else "All colors must be unique."
-        )
-
-        turns_text = (
-            "You have unlimited guesses."
-            if self.game_config.max_turns is None
-            else f"You have a maximum of {self.game_config.max_turns} guesses."
-        )
-
-        return f"""You are playing Mastermind.
-
-RULES:
-- The secret code has {self.game_config.num_pegs} positions
-- Each position contains a color numbered from 0 to {self.game_config.num_colors - 1}
-- {duplicates_text}
-- {turns_text}
+    def _render_turn(self, turn_number: int, turn: dict) -> str:
+        """Render one history turn as prompt text."""
+        text = f"Turn {turn_number}:\nGuess: {turn['guess']}\n"
+        if turn.get('feedback'):
+            fb = turn['feedback']
+            text += f"Feedback: {fb['black']} black, {fb['white']} white\n"
+        elif turn.get('error'):
+            text += f"Error: {turn['error']}\n"
+        return text + "\n"
 
-FEEDBACK:
-- Black pegs: correct color in correct position
-- White pegs: correct color in wrong position
-- You are NOT told which positions are correct
-
-RESPONSE FORMAT:
-Respond with ONLY a JSON object containing your guess.
-{{"guess": [{', '.join(str(i) for i in range(self.game_config.num_pegs))}]}}
+    def _build_prompt(self, game_history: list[dict], retry_count: int) -> str:
+        """Build complete prompt text for clipboard.
 
-Do not include any other text or explanation outside the JSON object."""
+        History is append-only, so previously rendered turns are cached and
+        only the new turns are rendered — O(new turns) per call instead of
+        O(total turns).
+        """
+        # New game with the same player instance: discard the stale cache
+        if len(game_history) < self._rendered_turns:
+            self._history_buf = bytearray()
+            self._rendered_turns = 0
 
-    def _build_prompt(self, game_history: list[dict], retry_count: int) -> str:
-        """Build complete prompt text for clipboard."""
-        prompt = self.system_prompt + "\n\n"
+        for i in range(self._rendered_turns, len(game_history)):
+            self._history_buf += self._render_turn(i + 1, game_history[i]).encode()
+        self._rendered_turns = len(game_history)
 
         if not game_history:
-            prompt += "Make your first guess."
+            return self.system_prompt + "\n\nMake your first guess."
+
+        if retry_count > 0:
+            instruction = "Your last guess was invalid. Provide a valid guess in JSON format.\n"
         else:
-            prompt += "GAME HISTORY:\n\n"
-            for i, turn in enumerate(game_history, 1):
-                prompt += f"Turn {i}:\n"
-                prompt += f"Guess: {turn['guess']}\n"
-                if turn.get('feedback'):
-                    fb = turn['feedback']
-                    prompt += f"Feedback: {fb['black']} black, {fb['white']} white\n"
-                elif turn.get('error'):
-                    prompt += f"Error: {turn['error']}\n"
-                prompt += "\n"
-
-            if retry_count > 0:
-                prompt += "Your last guess was invalid. Provide a valid guess in JSON format.\n"
-            else:
-                prompt += "Provide your next guess in JSON format.\n"
-
-        return prompt
+            instruction = "Provide your next guess in JSON format.\n"
+        return (f"{self.system_prompt}\n\nGAME HISTORY:\n\n"
+                f"{self._history_buf.decode()}{instruction}")
 
     def _parse_response(self, response: str) -> Optional[list[int]]:
         """Extract guess from JSON response."""
-        try:
-            # Try direct JSON parse
-            data = json.loads(response.strip())
-            if "guess" in data and isinstance(data["guess"], list):
-                return data["guess"]
-        except json.JSONDecodeError:
-            # Try to extract JSON from markdown code blocks
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response, re.DOTALL)
-            if json_match:
-                try:
-                    data = json.loads(json_match.group(1))
-                    if "guess" in data and isinstance(data["guess"], list):
-                        return data["guess"]
-                except json.JSONDecodeError:
-                    pass
-
-        return None
+        return _prompt.parse_guess(response, self.game_config)
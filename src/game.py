@@ -4,6 +4,42 @@ from dataclasses import dataclass
 from typing import Optional
 import random
 
+try:
+    import numpy as np
+    # One Generator shared by all games: each secret is a single C-level
+    # draw instead of num_pegs interpreter-bound random calls
+    _RNG = np.random.default_rng()
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from . import _feedback
+
+# Per-turn scoring goes through the compiled kernel only when numba is
+# actually compiling it; interpreted, the kernel is slower than the
+# pure-Python path below
+_USE_KERNEL = NUMPY_AVAILABLE and _feedback.NUMBA_AVAILABLE
+
+
+def seed(value: Optional[int]) -> None:
+    """Seed secret generation for reproducibility.
+
+    Seeds both the stdlib random module (fallback path) and the numpy
+    Generator (fast path) so --seed behaves the same either way.
+    """
+    random.seed(value)
+    if NUMPY_AVAILABLE:
+        global _RNG
+        _RNG = np.random.default_rng(value)
+
+
+def generate_secrets(n: int, config: "GameConfig") -> list[list[int]]:
+    """Generate n random secrets in bulk for batch benchmark setup."""
+    if NUMPY_AVAILABLE and config.allow_duplicates:
+        draws = _RNG.integers(0, config.num_colors, size=(n, config.num_pegs))
+        return draws.tolist()
+    return [MastermindGame(config).secret for _ in range(n)]
+
 
 @dataclass
 class GameConfig:
@@ -27,11 +63,30 @@ class MastermindGame:
         """
         self.config = config
         self.secret = secret if secret is not None else self._generate_secret()
+        # Per-color counts of the secret, computed once for feedback scoring
+        self._secret_counts = [0] * config.num_colors
+        for color in self.secret:
+            self._secret_counts[color] += 1
+        # Kernel path: the secret array and scratch buffer persist for the
+        # whole game, so each turn only converts the guess
+        if _USE_KERNEL:
+            self._secret_arr = np.asarray(self.secret, dtype=np.int8)
+            self._counts_buf = np.zeros(config.num_colors, dtype=np.int32)
+        else:
+            self._secret_arr = None
         self.turns = 0
         self.won = False
 
     def _generate_secret(self) -> list[int]:
         """Generate random secret code according to config rules."""
+        if NUMPY_AVAILABLE:
+            if self.config.allow_duplicates:
+                return _RNG.integers(
+                    0, self.config.num_colors, size=self.config.num_pegs
+                ).tolist()
+            return _RNG.choice(
+                self.config.num_colors, size=self.config.num_pegs, replace=False
+            ).tolist()
         if self.config.allow_duplicates:
             return [random.randint(0, self.config.num_colors - 1)
                     for _ in range(self.config.num_pegs)]
@@ -90,36 +145,49 @@ class MastermindGame:
         """
         Calculate black and white pegs using standard Mastermind rules.
 
-        Algorithm:
-        1. Count exact position matches (black pegs)
-        2. Remove matched positions from both sequences
-        3. For remaining positions, count color matches (white pegs)
+        Algorithm (single pass over the guess plus one pass over colors):
+        1. Count exact position matches (black pegs) and per-color guess counts
+        2. Total color matches = sum over colors of min(guess count, secret count)
+        3. White pegs = total color matches - black pegs
 
         Returns:
             (black_pegs, white_pegs)
         """
+        if self._secret_arr is not None:
+            return _feedback.feedback_kernel(
+                np.asarray(guess, dtype=np.int8), self._secret_arr, self._counts_buf)
+
         black = 0
-        secret_remaining = []
-        guess_remaining = []
+        guess_counts = [0] * self.config.num_colors
 
-        # Step 1: Count black pegs and collect remaining positions
-        for i in range(len(self.secret)):
-            if guess[i] == self.secret[i]:
+        for g, s in zip(guess, self.secret):
+            if g == s:
                 black += 1
-            else:
-                secret_remaining.append(self.secret[i])
-                guess_remaining.append(guess[i])
-
-        # Step 2: Count white pegs from remaining positions
-        white = 0
-        for color in set(guess_remaining):
-            white += min(
-                guess_remaining.count(color),
-                secret_remaining.count(color)
-            )
+            guess_counts[g] += 1
+
+        white = sum(
+            gc if gc < sc else sc
+            for gc, sc in zip(guess_counts, self._secret_counts)
+        ) - black
 
         return black, white
 
+    def batch_feedback(self, guesses):
+        """
+        Score many candidate guesses against the secret at once.
+
+        Intended for solver workloads that evaluate the full candidate set;
+        uses the native kernels in _feedback (numba-accelerated when
+        available). Requires numpy.
+
+        Args:
+            guesses: (N, num_pegs) array-like of candidate codes
+
+        Returns:
+            (N, 2) int32 ndarray of (black, white) pairs
+        """
+        return _feedback.batch_feedback(guesses, self.secret, self.config.num_colors)
+
     def is_game_over(self) -> bool:
         """Check if game has ended (won or max turns reached)."""
         if self.won:
@@ -3,10 +3,9 @@
 from dataclasses import dataclass
 from typing import Optional
 import litellm
-import json
 import time
-import re
 
+from . import _json, _prompt
 from .game import GameConfig
 
 
@@ -15,7 +14,7 @@ class LLMConfig:
     """Configuration for LLM API calls."""
     model: str
     temperature: float = 0.7
-    max_tokens: int = 500
+    max_tokens: int = 64  # {"guess": [...]} only needs ~10 tokens
     use_parser_fallback: bool = False
     parser_model: str = "gpt-3.5-turbo"
     max_retries: int = 1  # Retries for invalid guesses
@@ -34,7 +33,25 @@ class LLMPlayer:
         """
         self.game_config = game_config
         self.llm_config = llm_config
-        self.system_prompt = self._build_system_prompt()
+        self.system_prompt = _prompt.build_system_prompt(game_config)
+        self._is_anthropic = llm_config.model.startswith(("claude", "anthropic/"))
+        # System and opening user messages never change; build them once
+        # and reuse them by reference in every _build_messages call
+        if self._is_anthropic:
+            # Mark the stable prefix for Anthropic prompt caching
+            self._system_msg = {"role": "system", "content": [{
+                "type": "text",
+                "text": self.system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]}
+        else:
+            self._system_msg = {"role": "system", "content": self.system_prompt}
+        self._first_user_msg = {"role": "user", "content": "Make your first guess."}
+        # Committed history (turns 1..n-1) rendered once as message pairs and
+        # kept byte-identical across calls so provider-side prompt caching
+        # can reuse the prefix
+        self._message_cache: list[dict] = []
+        self._cached_turns = 0
 
     def get_next_guess(self, game_history: list[dict], retry_count: int = 0) -> dict:
         """
@@ -86,6 +103,83 @@ class LLMPlayer:
                 "tokens": {"input": 0, "output": 0}
             }
 
+    def get_next_guess_batch(self, histories: list[list[dict]]) -> list[dict]:
+        """
+        Get guesses for many independent game histories in one batch.
+
+        Calls are embarrassingly parallel (network-bound), so they are
+        dispatched through litellm.batch_completion when available and a
+        thread pool otherwise. Retry/backoff runs per call so a slow or
+        failing request does not hold up the rest of the batch.
+
+        Returns:
+            One result dict per history, in the same order (same shape as
+            get_next_guess).
+        """
+        # The incremental message cache assumes one game per player;
+        # batch histories are independent games, so rebuild from scratch
+        all_messages = []
+        for history in histories:
+            self._message_cache = []
+            self._cached_turns = 0
+            all_messages.append(self._build_messages(history, 0))
+        self._message_cache = []
+        self._cached_turns = 0
+
+        responses = None
+        if hasattr(litellm, 'batch_completion'):
+            try:
+                responses = litellm.batch_completion(
+                    model=self.llm_config.model,
+                    messages=all_messages,
+                    temperature=self.llm_config.temperature,
+                    max_tokens=self.llm_config.max_tokens
+                )
+            except Exception:
+                responses = None
+
+        if responses is None:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(16, len(all_messages) or 1)) as executor:
+                futures = [executor.submit(self._api_call_with_retry, m) for m in all_messages]
+                responses = []
+                for future in futures:
+                    try:
+                        responses.append(future.result())
+                    except Exception as e:
+                        responses.append(e)
+
+        results = []
+        for response in responses:
+            if isinstance(response, Exception):
+                results.append({
+                    "guess": None,
+                    "raw_response": "",
+                    "parsed": False,
+                    "error": str(response),
+                    "tokens": {"input": 0, "output": 0}
+                })
+                continue
+
+            raw_response = response.choices[0].message.content
+            tokens = {
+                "input": response.usage.prompt_tokens,
+                "output": response.usage.completion_tokens
+            }
+            guess = self._parse_response(raw_response)
+            if guess is None and self.llm_config.use_parser_fallback:
+                guess = self._fallback_parse(raw_response)
+
+            results.append({
+                "guess": guess,
+                "raw_response": raw_response,
+                "parsed": guess is not None,
+                "error": None if guess is not None else "Failed to parse response",
+                "tokens": tokens
+            })
+
+        return results
+
     def _api_call_with_retry(self, messages: list[dict], max_attempts: int = 3):
         """Make API call with exponential backoff for network errors."""
         for attempt in range(max_attempts):
@@ -102,85 +196,87 @@ class LLMPlayer:
                 wait_time = 2 ** attempt  # 1s, 2s, 4s
                 time.sleep(wait_time)
 
-    def _build_system_prompt(self) -> str:
-        """Build system prompt based on game configuration."""
-        duplicates_text = (
-            "Duplicate colors are allowed."
-            if self.game_config.allow_duplicates
-            else "All colors must be unique."
-        )
-
-        turns_text = (
-            "You have unlimited guesses."
-            if self.game_config.max_turns is None
-            else f"You have a maximum of {self.game_config.max_turns} guesses."
-        )
+    def _render_turn(self, turn_number: int, turn: dict) -> str:
+        """Render a single history turn as one compact prompt line.
 
-        return f"""You are playing Mastermind.
-
-RULES:
-- The secret code has {self.game_config.num_pegs} positions
-- Each position contains a color numbered from 0 to {self.game_config.num_colors - 1}
-- {duplicates_text}
-- {turns_text}
-
-FEEDBACK:
-- Black pegs: correct color in correct position
-- White pegs: correct color in wrong position
-- You are NOT told which positions are correct
-
-RESPONSE FORMAT:
-Respond with ONLY a JSON object containing your guess.
-{{"guess": [{', '.join(str(i) for i in range(self.game_config.num_pegs))}]}}
-
-Do not include any other text or explanation outside the JSON object."""
+        The compact form (T1 G=[1, 2, 3, 4] B=1 W=1) roughly halves the
+        history token cost versus the old multi-line rendering; input
+        tokens dominate price and latency on long games.
+        """
+        if turn.get('feedback'):
+            fb = turn['feedback']
+            return f"T{turn_number} G={turn['guess']} B={fb['black']} W={fb['white']}\n"
+        if turn.get('error'):
+            return f"T{turn_number} G={turn['guess']} E={turn['error']}\n"
+        return f"T{turn_number} G={turn['guess']}\n"
 
     def _build_messages(self, game_history: list[dict], retry_count: int) -> list[dict]:
-        """Build message array for API call."""
-        messages = [{"role": "system", "content": self.system_prompt}]
+        """Build message array for API call.
+
+        History is emitted as alternating assistant (guess) / user
+        (feedback) pairs instead of one concatenated user message, so the
+        committed turns form a byte-identical token prefix across calls —
+        the layout provider-side prefix caching keys on. Only the newest
+        turn and the trailing instruction vary between calls.
+        """
+        messages = [self._system_msg, self._first_user_msg]
 
-        # Build history
         if not game_history:
-            user_content = "Make your first guess."
+            return messages
+
+        # New game with the same player instance: discard the stale cache
+        if len(game_history) - 1 < self._cached_turns:
+            self._message_cache = []
+            self._cached_turns = 0
+
+        # Fold committed turns (all but the newest) into the message cache.
+        # History is append-only, so cached entries never change.
+        for i in range(self._cached_turns, len(game_history) - 1):
+            self._append_turn_pair(i + 1, game_history[i])
+        self._cached_turns = len(game_history) - 1
+
+        messages.extend(self._message_cache)
+
+        if self._is_anthropic and self._message_cache:
+            # Move the cache breakpoint to the end of the committed segment
+            last = dict(self._message_cache[-1])
+            last["content"] = [{
+                "type": "text",
+                "text": last["content"],
+                "cache_control": {"type": "ephemeral"}
+            }]
+            messages[-1] = last
+
+        # Newest turn plus the instruction — the dynamic suffix
+        newest = game_history[-1]
+        messages.append({
+            "role": "assistant",
+            "content": _json.dumps({"guess": newest.get('guess')})
+        })
+        if retry_count > 0:
+            instruction = "Your last guess was invalid. Please provide a valid guess in the correct JSON format."
         else:
-            history_text = "Previous guesses:\n\n"
-            for i, turn in enumerate(game_history, 1):
-                history_text += f"Turn {i}:\n"
-                history_text += f"Guess: {turn['guess']}\n"
-                if turn.get('feedback'):
-                    fb = turn['feedback']
-                    history_text += f"Feedback: {fb['black']} black, {fb['white']} white\n"
-                elif turn.get('error'):
-                    history_text += f"Error: {turn['error']}\n"
-                history_text += "\n"
-
-            if retry_count > 0:
-                user_content = history_text + "Your last guess was invalid. Please provide a valid guess in the correct JSON format."
-            else:
-                user_content = history_text + "Provide your next guess."
-
-        messages.append({"role": "user", "content": user_content})
+            instruction = "Provide your next guess."
+        messages.append({
+            "role": "user",
+            "content": self._render_turn(len(game_history), newest) + instruction
+        })
         return messages
 
+    def _append_turn_pair(self, turn_number: int, turn: dict) -> None:
+        """Append one committed turn to the cached message pairs."""
+        self._message_cache.append({
+            "role": "assistant",
+            "content": _json.dumps({"guess": turn.get('guess')})
+        })
+        self._message_cache.append({
+            "role": "user",
+            "content": self._render_turn(turn_number, turn).rstrip("\n")
+        })
+
     def _parse_response(self, response: str) -> Optional[list[int]]:
         """Extract guess from JSON response."""
-        try:
-            # Try direct JSON parse
-            data = json.loads(response.strip())
-            if "guess" in data and isinstance(data["guess"], list):
-                return data["guess"]
-        except json.JSONDecodeError:
-            # Try to extract JSON from markdown code blocks
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response, re.DOTALL)
-            if json_match:
-                try:
-                    data = json.loads(json_match.group(1))
-                    if "guess" in data and isinstance(data["guess"], list):
-                        return data["guess"]
-                except json.JSONDecodeError:
-                    pass
-
-        return None
+        return _prompt.parse_guess(response, self.game_config)
 
     def _fallback_parse(self, response: str) -> Optional[list[int]]:
         """Use parser model to extract guess from malformed response."""
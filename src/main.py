@@ -1,54 +1,137 @@
 """CLI entry point for Mastermind LLM Benchmark."""
 
 import argparse
+import functools
 import json
-import random
+import os
+import re
 import sys
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
-from dataclasses import asdict
+from dataclasses import fields
 
-from .game import GameConfig, MastermindGame
-from .llm_player import LLMPlayer, LLMConfig
-from .clipboard_player import ClipboardPlayer
-from .cli_player import CLIPlayer, CLIConfig
+from . import _json
+from .game import GameConfig, MastermindGame, seed as seed_rng
 from .runner import GameSession
 
-try:
-    import psutil
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
+def _result_to_dict(result) -> dict:
+    """Shallow dict view of a GameResult for serialization.
 
+    GameResult's fields are primitives or already-plain dicts/lists, so
+    this skips the recursive deepcopy dataclasses.asdict performs.
+    """
+    return {f.name: getattr(result, f.name) for f in fields(result)}
 
-def parse_secret(secret_str: str, num_pegs: int, num_colors: int) -> list[int]:
-    """Parse secret from comma-separated string."""
-    try:
-        secret = [int(x.strip()) for x in secret_str.split(',')]
-        if len(secret) != num_pegs:
-            raise ValueError(f"Secret must have {num_pegs} values")
-        if not all(0 <= x < num_colors for x in secret):
-            raise ValueError(f"Secret values must be between 0 and {num_colors - 1}")
-        return secret
-    except Exception as e:
-        raise ValueError(f"Invalid secret format: {e}")
+
+# Matches one comma-separated non-negative integer, with whitespace
+_SECRET_RE = re.compile(r'\s*(\d+)\s*(?:,|$)')
+
+# Outcome -> summary-counter key, resolved once instead of per game
+_OUTCOME_KEY = {"win": "wins", "loss": "losses", "error": "errors"}
+
+# Interned turn-dict keys: lookups in the verbose loop hit the dict's
+# identity fast path instead of re-hashing the literals each iteration
+_K_TNUM, _K_GUESS, _K_FB, _K_BLACK, _K_WHITE = map(
+    sys.intern, ('turn_number', 'guess', 'feedback', 'black', 'white'))
+
+
+def _handle_results(results_iter, args, results_summary, f, completed=False):
+    """Consume (run, result) pairs: tally, write JSONL, print progress.
+
+    With completed=True each game gets a "completed" header as its
+    result arrives (concurrent runs finish out of order relative to
+    their start); sequential callers print the plain header themselves
+    before dispatching each game.
+    """
+    for run, result in results_iter:
+        if completed:
+            print(f"Game {run}/{args.runs} completed")
+
+        # Update summary
+        results_summary[_OUTCOME_KEY[result.outcome]] += 1
+        results_summary["total_duration"] += result.duration_seconds
+
+        # Write result
+        record = _json.dumps_bytes(_result_to_dict(result))
+        f.write(record)
+        f.write(b'\n')
+
+        if args.emit_records:
+            # Machine-readable copy on stdout so a driving process can
+            # aggregate while games are still running; flushed per record.
+            # Human progress lines never start with '{'.
+            sys.stdout.flush()
+            sys.stdout.buffer.write(record + b'\n')
+            sys.stdout.buffer.flush()
+
+        # Print summary
+        if result.outcome == "win":
+            results_summary["sum_turns_wins"] += result.total_turns
+            print(f"  Won in {result.total_turns} turns")
+        elif result.outcome == "loss":
+            print(f"  Lost after {result.total_turns} turns")
+        else:
+            print(f"  Error: {result.turns[-1].get('error', 'Unknown error') if result.turns else 'Unknown error'}")
+
+        if args.verbose and result.turns:
+            # One buffered write for the whole block instead of a print
+            # (stdout lock + possible flush) per turn
+            lines = [f"  Secret: {result.secret}"]
+            for turn in result.turns:
+                if turn.get(_K_GUESS):
+                    fb = turn.get(_K_FB) or {}
+                    lines.append(f"    Turn {turn[_K_TNUM]}: {turn[_K_GUESS]} -> {fb.get(_K_BLACK, 0)}B {fb.get(_K_WHITE, 0)}W")
+            lines.append("")
+            sys.stdout.write('\n'.join(lines) + '\n')
+        else:
+            print()
 
 
+def parse_secret(secret_str: str, num_pegs: int, num_colors: int) -> list[int]:
+    """Parse secret from comma-separated string."""
+    secret = []
+    pos = 0
+    for m in _SECRET_RE.finditer(secret_str):
+        if m.start() != pos:
+            break
+        secret.append(int(m.group(1)))
+        pos = m.end()
+    # The matches must tile the whole string (with no trailing comma),
+    # otherwise there was garbage
+    if pos != len(secret_str) or not secret or secret_str.rstrip().endswith(','):
+        raise ValueError("Invalid secret format: expected comma-separated integers")
+    if len(secret) != num_pegs:
+        raise ValueError(f"Invalid secret format: Secret must have {num_pegs} values")
+    if min(secret) < 0 or max(secret) >= num_colors:
+        raise ValueError(f"Invalid secret format: Secret values must be between 0 and {num_colors - 1}")
+    return secret
+
+
+@functools.lru_cache(maxsize=1)
 def detect_parent_cli():
     """
     Detect if running from a CLI tool (claude, codex, or gemini).
     Returns the CLI tool name or None if not detected.
+
+    The process tree can't change between calls within one run, so the
+    walk happens once and the result is memoized. psutil is imported here
+    rather than at module level: api/clipboard runs never reach this.
     """
-    if not PSUTIL_AVAILABLE:
+    try:
+        import psutil
+    except ImportError:
         return None
 
     try:
-        current = psutil.Process()
-        parent = current.parent()
+        parent = psutil.Process().parent()
 
-        # Walk up process tree looking for CLI tools
+        # Walk up process tree looking for CLI tools. as_dict batches the
+        # name and ppid reads into one /proc pass per process.
         while parent:
-            name = parent.name().lower()
+            info = parent.as_dict(attrs=['name', 'ppid'])
+            name = (info['name'] or '').lower()
 
             # Check for CLI tools
             for cli in ['claude', 'codex', 'gemini']:
@@ -57,7 +140,7 @@ def detect_parent_cli():
 
             # Move to next parent
             try:
-                parent = parent.parent()
+                parent = psutil.Process(info['ppid'])
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 break
     except Exception:
@@ -66,8 +149,32 @@ def detect_parent_cli():
     return None
 
 
-def main():
-    """Main CLI entry point."""
+# Printed for bare -h/--help without building the full parser. This is
+# the only help -h ever shows, so it must list every flag: keep it in
+# sync with _build_parser() when adding or removing arguments
+_USAGE = """usage: python -m src.main [--mode {auto,api,cli,clipboard}] [--model MODEL]
+                          [--colors N] [--pegs N] [--no-duplicates] [--max-turns N]
+                          [--secret CSV] [--temperature T] [--max-tokens N]
+                          [--parser-fallback] [--parser-model MODEL] [--max-retries N]
+                          [--runs N] [--output FILE] [--seed N] [--concurrency N]
+                          [--verbose] [--max-api-calls N] [--timeout SECONDS]
+                          [--turn-log FILE] [--emit-records]
+                          [--no-json-schema] [--model-override MODEL]
+                          [--append-prompt TEXT] [--no-tools]
+                          [--prompt-prefix TEXT] [--strict-schema]
+                          [-h] [-V]
+
+Mastermind LLM Benchmark
+
+Common invocations:
+  python -m src.main --model gpt-4 --runs 10          # API mode
+  claude --print "python -m src.main --runs 10"       # CLI auto-detection
+  python -m src.main --mode clipboard --runs 5        # manual web-UI mode
+"""
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the full argument parser (deferred: help/version skip it)."""
     parser = argparse.ArgumentParser(
         description="Mastermind LLM Benchmark",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -128,8 +235,8 @@ CLI detection (auto-mode):
     llm_group = parser.add_argument_group('llm configuration (api mode only)')
     llm_group.add_argument('--temperature', type=float, default=0.7,
                            help='Temperature (default: 0.7)')
-    llm_group.add_argument('--max-tokens', type=int, default=500,
-                           help='Max tokens (default: 500)')
+    llm_group.add_argument('--max-tokens', type=int, default=64,
+                           help='Max tokens (default: 64, matches LLMConfig)')
     llm_group.add_argument('--parser-fallback', action='store_true',
                            help='Enable parser fallback for malformed responses')
     llm_group.add_argument('--parser-model', type=str, default='gpt-3.5-turbo',
@@ -145,6 +252,8 @@ CLI detection (auto-mode):
                             help='Output JSONL file (default: outputs/results_TIMESTAMP.jsonl)')
     exec_group.add_argument('--seed', type=int, default=None,
                             help='Random seed for reproducibility')
+    exec_group.add_argument('--concurrency', type=int, default=1,
+                            help='Games to run in parallel (default: 1; >1 voids --seed reproducibility)')
     exec_group.add_argument('--verbose', action='store_true',
                             help='Verbose logging')
     exec_group.add_argument('--max-api-calls', type=int, default=100,
@@ -153,6 +262,8 @@ CLI detection (auto-mode):
                             help='Maximum seconds per game (safety limit, default: 300)')
     exec_group.add_argument('--turn-log', type=str, default=None,
                             help='Output JSONL file for per-turn logging (optional, for progress monitoring)')
+    exec_group.add_argument('--emit-records', action='store_true',
+                            help='Also print each result record as a JSON line on stdout (for orchestration)')
 
     # CLI flag testing options
     cli_test_group = parser.add_argument_group('cli flag testing (cli mode only)')
@@ -181,6 +292,44 @@ CLI detection (auto-mode):
         help='Use additionalProperties:false (Test L)'
     )
 
+    # Mirror of the bare-argv fast path, so -V works in any invocation
+    # and shows up in the full parser's --help
+    from . import __version__
+    parser.add_argument('-V', '--version', action='version', version=__version__)
+
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    # Fast paths: answer help/version without constructing the parser,
+    # its argument groups, or the long epilog string
+    if len(sys.argv) == 2 and sys.argv[1] in ('-V', '--version'):
+        from . import __version__
+        print(__version__)
+        return
+    if sys.argv[1:] in (['-h'], ['--help']):
+        print(_USAGE)
+        return
+
+    # Phase 1: validate the essential game-shape arguments with a minimal
+    # parser, so a bad invocation exits before the full parser (and any
+    # backend import work downstream) is built
+    essential = argparse.ArgumentParser(add_help=False)
+    essential.add_argument('--colors', type=int, default=6)
+    essential.add_argument('--pegs', type=int, default=4)
+    essential.add_argument('--no-duplicates', action='store_true')
+    known, _ = essential.parse_known_args()
+
+    if known.colors < 2:
+        essential.error("--colors must be at least 2")
+    if known.pegs < 1:
+        essential.error("--pegs must be at least 1")
+    if known.no_duplicates and known.colors < known.pegs:
+        essential.error(f"Need at least {known.pegs} colors when duplicates are not allowed")
+
+    # Phase 2: the full parser
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Determine execution mode
@@ -223,18 +372,9 @@ CLI detection (auto-mode):
     if final_mode == 'clipboard' and not args.model:
         args.model = "web-ui"  # Default label for web-based interfaces
 
-    if args.colors < 2:
-        parser.error("--colors must be at least 2")
-
-    if args.pegs < 1:
-        parser.error("--pegs must be at least 1")
-
-    if not args.no_duplicates and args.colors < args.pegs:
-        parser.error(f"Need at least {args.pegs} colors when duplicates are not allowed")
-
     # Set random seed
     if args.seed is not None:
-        random.seed(args.seed)
+        seed_rng(args.seed)
 
     # Parse secret if provided
     predefined_secret = None
@@ -242,14 +382,16 @@ CLI detection (auto-mode):
         predefined_secret = parse_secret(args.secret, args.pegs, args.colors)
         print(f"Using predefined secret: {predefined_secret}")
 
-    # Setup output file
-    if args.output is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = Path("outputs") / f"results_{timestamp}.jsonl"
-    else:
+    # Setup output file. time.strftime formats the timestamp without
+    # constructing a datetime object; mkdir is skipped when the parent
+    # already exists (the common warm-rerun case).
+    if args.output:
         output_path = Path(args.output)
+    else:
+        output_path = Path("outputs") / f"results_{time.strftime('%Y%m%d_%H%M%S')}.jsonl"
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if not output_path.parent.exists():
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Create game config
     game_config = GameConfig(
@@ -261,6 +403,9 @@ CLI detection (auto-mode):
 
     # Create player based on final mode
     if final_mode == 'api':
+        # Player backends import lazily so each run only pays for the
+        # dependency chain of the mode it uses (litellm is the heavy one)
+        from .llm_player import LLMPlayer, LLMConfig
         from dotenv import load_dotenv
         load_dotenv()
 
@@ -272,10 +417,12 @@ CLI detection (auto-mode):
             parser_model=args.parser_model,
             max_retries=args.max_retries
         )
-        player = LLMPlayer(game_config, llm_config)
+        def make_player():
+            return LLMPlayer(game_config, llm_config)
         player_label = args.model
         cost_info = "(paid)"
     elif final_mode == 'cli':
+        from .cli_player import CLIPlayer, CLIConfig
         cli_config = CLIConfig(
             cli_tool=detected_cli,
             timeout=120,
@@ -287,11 +434,15 @@ CLI detection (auto-mode):
             prompt_prefix=args.prompt_prefix,
             strict_schema=args.strict_schema
         )
-        player = CLIPlayer(game_config, cli_config)
+        def make_player():
+            return CLIPlayer(game_config, cli_config)
         player_label = f"{detected_cli}-cli"
         cost_info = "(free with subscription)"
     else:  # clipboard
-        player = ClipboardPlayer(game_config, args.model)
+        from .clipboard_player import ClipboardPlayer
+
+        def make_player():
+            return ClipboardPlayer(game_config, args.model)
         player_label = args.model
         cost_info = "(manual)"
 
@@ -303,7 +454,9 @@ CLI detection (auto-mode):
     print(f"Output: {output_path}")
     print()
 
-    results_summary = {"wins": 0, "losses": 0, "errors": 0}
+    results_summary = {"wins": 0, "losses": 0, "errors": 0,
+                       "sum_turns_wins": 0, "total_duration": 0.0}
+    write_lock = threading.Lock()
 
     # Setup turn log if specified
     turn_log_file = None
@@ -325,64 +478,87 @@ CLI detection (auto-mode):
                 "secret": secret,
                 "timestamp": datetime.now().isoformat()
             }
-            turn_log_file.write(json.dumps(log_entry) + '\n')
-            turn_log_file.flush()
-
-    with open(output_path, 'a') as f:
-        for run in range(1, args.runs + 1):
-            print(f"Game {run}/{args.runs}")
-
-            # Create session with optional predefined secret and safety limits
-            session = GameSession(
-                game_config,
-                player,
-                args.max_retries,
-                secret=predefined_secret,
-                max_api_calls=args.max_api_calls,
-                timeout_seconds=args.timeout,
-                turn_callback=turn_callback
-            )
-            session.game_num = run
-            result = session.run()
-
-            # Update summary
-            outcome_key = {"win": "wins", "loss": "losses", "error": "errors"}[result.outcome]
-            results_summary[outcome_key] += 1
-
-            # Write result
-            f.write(json.dumps(asdict(result)) + '\n')
-            f.flush()
-
-            # Print summary
-            if result.outcome == "win":
-                print(f"  Won in {result.total_turns} turns")
-            elif result.outcome == "loss":
-                print(f"  Lost after {result.total_turns} turns")
-            else:
-                print(f"  Error: {result.turns[-1].get('error', 'Unknown error') if result.turns else 'Unknown error'}")
+            with write_lock:
+                turn_log_file.write(json.dumps(log_entry) + '\n')
+                turn_log_file.flush()
+
+    def run_game(run: int, player):
+        """Run one game session for game number `run`."""
+        session = GameSession(
+            game_config,
+            player,
+            args.max_retries,
+            secret=predefined_secret,
+            max_api_calls=args.max_api_calls,
+            timeout_seconds=args.timeout,
+            turn_callback=turn_callback
+        )
+        session.game_num = run
+        return session.run()
+
+    # Binary append so orjson's bytes go straight to the file with no
+    # str round-trip; the batch still ends with one flush + fsync
+    with open(output_path, 'ab') as f:
+        if args.concurrency > 1:
+            # Games are network-latency bound, so threads give near-linear
+            # wall-time scaling up to provider rate limits. Players keep
+            # per-game caches, so each session gets its own; only the turn
+            # callback runs in worker threads (hence the write lock), and
+            # results come back from executor.map in submission order so
+            # the output handling below stays single-threaded.
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+                results_iter = enumerate(
+                    executor.map(lambda run: run_game(run, make_player()),
+                                 range(1, args.runs + 1)),
+                    1
+                )
+                _handle_results(results_iter, args, results_summary, f,
+                                completed=True)
+        else:
+            # Sequential default: one player reused across games, and
+            # --seed reproducibility is preserved
+            shared_player = make_player()
 
-            if args.verbose and result.turns:
-                print(f"  Secret: {result.secret}")
-                for turn in result.turns:
-                    if turn.get('guess'):
-                        fb = turn.get('feedback', {})
-                        print(f"    Turn {turn['turn_number']}: {turn['guess']} -> {fb.get('black', 0)}B {fb.get('white', 0)}W")
+            def sequential_games():
+                """Yield (run, result), announcing each game before it runs."""
+                for run in range(1, args.runs + 1):
+                    # Header goes out before the session starts, so a
+                    # long API game (or the clipboard interaction) shows
+                    # under its own banner instead of after the fact
+                    print(f"Game {run}/{args.runs}")
+                    yield run, run_game(run, shared_player)
 
-            print()
+            _handle_results(sequential_games(), args, results_summary, f)
+
+        # One durability point for the whole batch
+        f.flush()
+        os.fsync(f.fileno())
 
     # Close turn log file if opened
     if turn_log_file:
         turn_log_file.close()
 
-    # Final summary
-    print("=" * 60)
-    print("SUMMARY")
-    print("=" * 60)
-    print(f"Total games: {args.runs}")
-    print(f"Wins: {results_summary['wins']} ({results_summary['wins']/args.runs*100:.1f}%)")
-    print(f"Losses: {results_summary['losses']} ({results_summary['losses']/args.runs*100:.1f}%)")
-    print(f"Errors: {results_summary['errors']} ({results_summary['errors']/args.runs*100:.1f}%)")
-    print(f"\nResults saved to: {output_path}")
+    if args.emit_records:
+        # Terminating summary record: the driving process can read these
+        # five counters directly instead of re-aggregating every record
+        sys.stdout.flush()
+        sys.stdout.buffer.write(_json.dumps_bytes({"__summary__": results_summary}) + b'\n')
+        sys.stdout.buffer.flush()
+
+    # Final summary, emitted as one write (guard total against --runs 0)
+    total = args.runs or 1
+    bar = "=" * 60
+    sys.stdout.write(f"""{bar}
+SUMMARY
+{bar}
+Total games: {args.runs}
+Wins: {results_summary['wins']} ({results_summary['wins']/total*100:.1f}%)
+Losses: {results_summary['losses']} ({results_summary['losses']/total*100:.1f}%)
+Errors: {results_summary['errors']} ({results_summary['errors']/total*100:.1f}%)
+
+Results saved to: {output_path}
+""")
     if args.turn_log:
         print(f"Turn log saved to: {args.turn_log}")
 
@@ -1,45 +1,202 @@
 """Orchestrator for batch testing multiple models with same secret."""
 
 import argparse
-import subprocess
+import asyncio
+import functools
 import json
+import os
+import shutil
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
-from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Optional
 
+from . import _json
+
 
 def parse_secret(secret_str: str, num_pegs: int, num_colors: int) -> list[int]:
-    """Parse secret from comma-separated string."""
-    try:
-        secret = [int(x.strip()) for x in secret_str.split(',')]
-        if len(secret) != num_pegs:
-            raise ValueError(f"Secret must have {num_pegs} values")
-        if not all(0 <= x < num_colors for x in secret):
-            raise ValueError(f"Secret values must be between 0 and {num_colors - 1}")
-        return secret
-    except Exception as e:
-        raise ValueError(f"Invalid secret format: {e}")
+    """Parse secret from comma-separated string.
+
+    Conversion and bounds checking happen in one traversal, with the
+    length check last.
+    """
+    secret = []
+    for token in secret_str.split(','):
+        try:
+            value = int(token)
+        except ValueError:
+            raise ValueError(f"Invalid secret format: invalid literal {token.strip()!r}")
+        if not 0 <= value < num_colors:
+            raise ValueError(f"Invalid secret format: Secret values must be between 0 and {num_colors - 1}")
+        secret.append(value)
+    if len(secret) != num_pegs:
+        raise ValueError(f"Invalid secret format: Secret must have {num_pegs} values")
+    return secret
+
+
+# CLI tool name -> resolved executable path (None when not installed),
+# looked up once per orchestrator run
+_CLI_TOOL_PATHS: dict = {}
+
+
+def _cli_tool_path(tool: str) -> Optional[str]:
+    """Resolve and cache the executable path for a CLI tool."""
+    if tool not in _CLI_TOOL_PATHS:
+        _CLI_TOOL_PATHS[tool] = shutil.which(tool)
+    return _CLI_TOOL_PATHS[tool]
+
+
+def _make_game_config(colors: int, pegs: int, no_duplicates: bool, max_turns: int):
+    """Build a GameConfig from orchestrator-level arguments."""
+    from .game import GameConfig
+
+    return GameConfig(
+        num_colors=colors,
+        num_pegs=pegs,
+        allow_duplicates=not no_duplicates,
+        max_turns=max_turns
+    )
+
+
+def _run_sessions_inprocess(
+    game_config,
+    player,
+    secret: list[int],
+    runs: int,
+    output_file: Path,
+    cancel: Optional[threading.Event] = None
+) -> tuple[int, int, int, int, float]:
+    """Run one model's games in-process, writing records to output_file.
+
+    A worker thread cannot be interrupted from outside, so the caller
+    passes a cancel event instead; the loop checks it between games and
+    stops appending once it is set.
+
+    Returns:
+        (wins, losses, errors, sum_turns_wins, total_duration)
+    """
+    from dataclasses import fields
+
+    from .runner import GameSession
+
+    wins = losses = errors = sum_turns_wins = 0
+    total_duration = 0.0
+    with open(output_file, 'ab') as f:
+        for run in range(1, runs + 1):
+            if cancel is not None and cancel.is_set():
+                break
+            session = GameSession(game_config, player, secret=secret)
+            session.game_num = run
+            result = session.run()
+            f.write(_json.dumps_bytes(
+                {fld.name: getattr(result, fld.name) for fld in fields(result)}
+            ))
+            f.write(b'\n')
+            if result.outcome == 'win':
+                wins += 1
+                sum_turns_wins += result.total_turns
+            elif result.outcome == 'loss':
+                losses += 1
+            else:
+                errors += 1
+            total_duration += result.duration_seconds
+    return wins, losses, errors, sum_turns_wins, total_duration
+
+
+def _run_cli_inprocess(
+    model_id: str,
+    secret: list[int],
+    runs: int,
+    colors: int,
+    pegs: int,
+    no_duplicates: bool,
+    max_turns: int,
+    output_file: Path,
+    cancel: Optional[threading.Event] = None
+) -> tuple[int, int, int, int, float]:
+    """Run a CLI-tool benchmark in-process.
+
+    CLI models previously went through a python -m src.main child, which
+    then spawned the CLI binary per turn — two levels of process launch.
+    The game loop runs here instead, so only the CLI tool itself is
+    spawned.
+    """
+    from .cli_player import CLIPlayer, CLIConfig
+
+    if _cli_tool_path(model_id) is None:
+        raise RuntimeError(f"{model_id} CLI not found in PATH")
+
+    game_config = _make_game_config(colors, pegs, no_duplicates, max_turns)
+    player = CLIPlayer(game_config, CLIConfig(cli_tool=model_id, timeout=120))
+    return _run_sessions_inprocess(
+        game_config, player, secret, runs, output_file, cancel)
+
 
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load API credentials from .env, once per process."""
+    from dotenv import load_dotenv
+    load_dotenv()
 
+
+def _run_api_inprocess(
+    model_id: str,
+    secret: list[int],
+    runs: int,
+    colors: int,
+    pegs: int,
+    no_duplicates: bool,
+    max_turns: int,
+    output_file: Path,
+    cancel: Optional[threading.Event] = None
+) -> tuple[int, int, int, int, float]:
+    """Run an API-model benchmark in-process.
+
+    Used for all-API batches, where per-model python -m src.main children
+    would each pay interpreter and litellm import startup for a workload
+    bounded entirely by HTTP round-trips.
+    """
+    from .llm_player import LLMPlayer, LLMConfig
+
+    # The src.main api branch loads .env before building its player; the
+    # in-process path must do the same or keys kept there are never seen
+    _load_env()
+    game_config = _make_game_config(colors, pegs, no_duplicates, max_turns)
+    player = LLMPlayer(game_config, LLMConfig(model=model_id))
+    return _run_sessions_inprocess(
+        game_config, player, secret, runs, output_file, cancel)
+
+
+_CLI_TOOLS = frozenset({'claude', 'codex', 'gemini'})
+
+# StreamReader buffer limit for child pipes. A record line embeds every
+# turn's raw_response, so it can run well past asyncio's 64 KiB default,
+# which makes readline() raise mid-run on a healthy child
+_STREAM_LIMIT = 8 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=64)
 def determine_model_mode(model: str) -> tuple[str, str]:
     """
     Determine if model is CLI or API mode.
 
+    Called once per model per attempt, so the result is memoized; the
+    frozenset lookup and .lower() only run on the first call per model.
+
     Returns:
         (mode, model_identifier) tuple
         mode: 'cli' or 'api'
         model_identifier: CLI tool name or API model string
     """
-    cli_tools = ['claude', 'codex', 'gemini']
-    if model.lower() in cli_tools:
-        return ('cli', model.lower())
+    lowered = model.lower()
+    if lowered in _CLI_TOOLS:
+        return ('cli', lowered)
     else:
         return ('api', model)
 
 
-def run_single_model(
+async def run_single_model_async(
     model: str,
     secret: list[int],
     runs: int,
@@ -49,11 +206,16 @@ def run_single_model(
     max_turns: int,
     output_file: Path,
     verbose: bool,
-    max_retries: int
+    max_retries: int,
+    in_process: bool = False
 ) -> dict:
     """
     Run benchmark for a single model.
 
+    Child benchmarks run via asyncio subprocesses, so many models overlap
+    in one orchestrator process instead of a process pool — the work is
+    LLM-latency bound, and the pool only added fork and pickle overhead.
+
     Returns:
         Summary dict with results
     """
@@ -77,6 +239,10 @@ def run_single_model(
 
     if verbose:
         cmd.append('--verbose')
+    else:
+        # Stream result records back over stdout so aggregation overlaps
+        # with the child's remaining games
+        cmd.append('--emit-records')
 
     # Run with retries
     # CLI tools need longer timeout due to verbose structured output
@@ -87,44 +253,88 @@ def run_single_model(
             if verbose:
                 print(f"Running {model} (attempt {attempt + 1}/{max_retries + 1})...")
 
-            result = subprocess.run(
-                cmd,
-                capture_output=not verbose,
-                text=True,
-                timeout=timeout
-            )
-
-            if result.returncode == 0:
-                # Success - read and parse results
-                if output_file.exists() and output_file.stat().st_size > 0:
-                    with open(output_file, 'r') as f:
-                        results = [json.loads(line) for line in f]
-
-                    # Calculate summary statistics
-                    wins = sum(1 for r in results if r['outcome'] == 'win')
-                    losses = sum(1 for r in results if r['outcome'] == 'loss')
-                    errors = sum(1 for r in results if r['outcome'] == 'error')
-                    avg_turns = sum(r['total_turns'] for r in results if r['outcome'] == 'win') / wins if wins > 0 else 0
-                    total_duration = sum(r['duration_seconds'] for r in results)
-
-                    return {
-                        'model': model,
-                        'mode': mode,
-                        'status': 'success',
-                        'runs': runs,
-                        'wins': wins,
-                        'losses': losses,
-                        'errors': errors,
-                        'win_rate': wins / runs if runs > 0 else 0,
-                        'avg_turns_when_won': round(avg_turns, 2),
-                        'total_duration': round(total_duration, 2),
-                        'output_file': str(output_file)
-                    }
+            if (mode == 'cli' and not verbose) or in_process:
+                # In-process game loop: no python -m src.main child. Runs
+                # on a worker thread so parallel models still overlap.
+                # Verbose CLI batches stay on the subprocess path below,
+                # which is what relays the child's live output.
+                runner = _run_cli_inprocess if mode == 'cli' else _run_api_inprocess
+                cancel = threading.Event()
+                worker = asyncio.ensure_future(asyncio.to_thread(
+                    runner, model_id, secret, runs, colors,
+                    pegs, no_duplicates, max_turns, output_file, cancel
+                ))
+                try:
+                    streamed = await asyncio.wait_for(
+                        asyncio.shield(worker), timeout=timeout
+                    )
+                except asyncio.TimeoutError:
+                    # The thread can't be killed like a child process;
+                    # signal it to stop at the next game boundary and
+                    # wait it out, so a retry never runs while the old
+                    # loop is still appending to output_file
+                    cancel.set()
+                    try:
+                        await worker
+                    except Exception:
+                        pass
+                    raise
+                stderr = b''
+                returncode = 0
+            else:
+                pipe = None if verbose else asyncio.subprocess.PIPE
+                # Plain argv with no preexec_fn lets CPython launch the
+                # child via vfork(), so the parent's address space is
+                # never copied. (posix_spawn is out of reach here: it
+                # requires close_fds=False, and subprocess defaults to
+                # close_fds=True.)
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd, stdout=pipe, stderr=pipe, limit=_STREAM_LIMIT
+                )
+                streamed = None
+                try:
+                    if verbose:
+                        await asyncio.wait_for(proc.wait(), timeout=timeout)
+                        stderr = b''
+                    else:
+                        streamed, stderr = await asyncio.wait_for(
+                            _communicate_streaming(proc), timeout=timeout
+                        )
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    raise
+                returncode = proc.returncode
+
+            if returncode == 0:
+                # Success - use the streamed aggregates, or re-read the
+                # output file when nothing was streamed (verbose mode, or
+                # an older child without --emit-records)
+                if streamed is not None and sum(streamed[:3]) > 0:
+                    wins, losses, errors, sum_turns_wins, total_duration = streamed
+                elif output_file.exists() and output_file.stat().st_size > 0:
+                    wins, losses, errors, sum_turns_wins, total_duration = \
+                        _aggregate_results(output_file)
                 else:
                     raise RuntimeError(f"Output file empty or missing: {output_file}")
 
+                avg_turns = sum_turns_wins / wins if wins > 0 else 0
+
+                return {
+                    'model': model,
+                    'mode': mode,
+                    'status': 'success',
+                    'runs': runs,
+                    'wins': wins,
+                    'losses': losses,
+                    'errors': errors,
+                    'win_rate': wins / runs if runs > 0 else 0,
+                    'avg_turns_when_won': round(avg_turns, 2),
+                    'total_duration': round(total_duration, 2),
+                    'output_file': str(output_file)
+                }
             else:
-                error_msg = result.stderr if result.stderr else "Unknown error"
+                error_msg = stderr.decode(errors='replace') if stderr else "Unknown error"
                 if attempt < max_retries:
                     print(f"  Failed (attempt {attempt + 1}), retrying... Error: {error_msg[:100]}")
                     continue
@@ -137,7 +347,7 @@ def run_single_model(
                         'output_file': str(output_file)
                     }
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             if attempt < max_retries:
                 print(f"  Timeout (attempt {attempt + 1}), retrying...")
                 continue
@@ -173,6 +383,132 @@ def run_single_model(
     }
 
 
+async def _communicate_streaming(proc) -> tuple[tuple[int, int, int, int, float], bytes]:
+    """Drain a child's pipes, aggregating result records as they arrive.
+
+    Lines starting with '{' are parsed as result records (the child's
+    --emit-records stream); everything else is the child's human-readable
+    progress output and is skipped. A terminating {"__summary__": ...}
+    record carries the child's own aggregates and wins over the
+    incremental count when present. stdout and stderr are consumed
+    concurrently to avoid pipe-buffer deadlock.
+
+    Returns:
+        ((wins, losses, errors, sum_turns_wins, total_duration), stderr)
+    """
+    wins = losses = errors = sum_turns_wins = 0
+    total_duration = 0.0
+    summary = None
+
+    async def read_records():
+        nonlocal wins, losses, errors, sum_turns_wins, total_duration, summary
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                break
+            if not line.startswith(b'{'):
+                continue
+            try:
+                r = _json.loads(line)
+            except ValueError:
+                continue
+            if '__summary__' in r:
+                summary = r['__summary__']
+                continue
+            outcome = r.get('outcome')
+            if outcome == 'win':
+                wins += 1
+                sum_turns_wins += r.get('total_turns', 0)
+            elif outcome == 'loss':
+                losses += 1
+            elif outcome == 'error':
+                errors += 1
+            else:
+                continue
+            total_duration += r.get('duration_seconds', 0.0)
+
+    _, stderr = await asyncio.gather(read_records(), proc.stderr.read())
+    await proc.wait()
+    if summary is not None:
+        return (summary.get('wins', wins), summary.get('losses', losses),
+                summary.get('errors', errors),
+                summary.get('sum_turns_wins', sum_turns_wins),
+                summary.get('total_duration', total_duration)), stderr
+    return (wins, losses, errors, sum_turns_wins, total_duration), stderr
+
+
+# Files below this size are parsed on one thread; thread startup would
+# cost more than it saves
+_PARALLEL_PARSE_THRESHOLD = 1_048_576
+_PARALLEL_PARSE_WORKERS = 4
+
+
+def _aggregate_chunk(data: bytes) -> tuple[int, int, int, int, float]:
+    """Aggregate one newline-delimited byte chunk of result records."""
+    wins = losses = errors = sum_turns_wins = 0
+    total_duration = 0.0
+    for line in data.split(b'\n'):
+        if not line:
+            continue
+        r = _json.loads(line)
+        outcome = r['outcome']
+        if outcome == 'win':
+            wins += 1
+            sum_turns_wins += r['total_turns']
+        elif outcome == 'loss':
+            losses += 1
+        else:
+            errors += 1
+        total_duration += r['duration_seconds']
+    return wins, losses, errors, sum_turns_wins, total_duration
+
+
+def _aggregate_results(output_file: Path) -> tuple[int, int, int, int, float]:
+    """Aggregate a results JSONL file in one fused pass.
+
+    Counts outcomes, win turns, and duration in one loop per chunk; _json
+    parses each line with orjson when installed. Multi-MB files are split
+    at newline boundaries and parsed on a few threads — orjson releases
+    the GIL inside its C parser, so the chunks genuinely overlap.
+
+    Returns:
+        (wins, losses, errors, sum_turns_wins, total_duration)
+    """
+    with open(output_file, 'rb') as f:
+        data = f.read()
+
+    if len(data) <= _PARALLEL_PARSE_THRESHOLD:
+        return _aggregate_chunk(data)
+
+    # Split at evenly spaced offsets snapped forward to a newline
+    chunks = []
+    start = 0
+    step = len(data) // _PARALLEL_PARSE_WORKERS
+    for _ in range(_PARALLEL_PARSE_WORKERS - 1):
+        pivot = data.find(b'\n', start + step)
+        if pivot == -1:
+            break
+        chunks.append(data[start:pivot])
+        start = pivot + 1
+    chunks.append(data[start:])
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        parts = list(executor.map(_aggregate_chunk, chunks))
+
+    wins = sum(p[0] for p in parts)
+    losses = sum(p[1] for p in parts)
+    errors = sum(p[2] for p in parts)
+    sum_turns_wins = sum(p[3] for p in parts)
+    total_duration = sum(p[4] for p in parts)
+    return wins, losses, errors, sum_turns_wins, total_duration
+
+
+def run_single_model(*task) -> dict:
+    """Synchronous wrapper around run_single_model_async."""
+    return asyncio.run(run_single_model_async(*task))
+
+
 def main():
     """Main orchestrator entry point."""
     parser = argparse.ArgumentParser(
@@ -216,6 +552,9 @@ Examples:
                         help='Number of games per model (default: 1)')
     parser.add_argument('--parallel', action='store_true',
                         help='Run models in parallel (default: sequential)')
+    parser.add_argument('--max-workers', type=int, default=None,
+                        help='Cap on concurrently running models with --parallel '
+                             '(default: min(models, 2x CPU count))')
     parser.add_argument('--max-retries', type=int, default=0,
                         help='Retry failed runs (default: 0)')
     parser.add_argument('--output-dir', type=str, default='outputs',
@@ -263,61 +602,73 @@ Examples:
     print("=" * 70)
     print()
 
-    # Prepare tasks
-    tasks = []
-    for model in models:
-        output_file = output_dir / f"{batch_name}_{model.replace('/', '_')}.jsonl"
-        tasks.append((
-            model,
-            secret,
-            args.runs,
-            args.colors,
-            args.pegs,
-            args.no_duplicates,
-            args.max_turns,
-            output_file,
-            args.verbose,
-            args.max_retries
-        ))
+    # Prepare tasks. The batch-invariant arguments are bound once with
+    # functools.partial; each task carries only what varies per model.
+    # All-API batches run the game loops in this process: subprocesses
+    # would only add ~100 ms interpreter startup per model to a workload
+    # whose bottleneck is the HTTP round-trip
+    all_api = all(determine_model_mode(m)[0] == 'api' for m in models)
+    run_bound = functools.partial(
+        run_single_model_async,
+        secret=secret,
+        runs=args.runs,
+        colors=args.colors,
+        pegs=args.pegs,
+        no_duplicates=args.no_duplicates,
+        max_turns=args.max_turns,
+        verbose=args.verbose,
+        max_retries=args.max_retries,
+        in_process=all_api and not args.verbose
+    )
+    tasks = [
+        (model, output_dir / f"{batch_name}_{model.replace('/', '_')}.jsonl")
+        for model in models
+    ]
 
     # Run tasks
     results = []
 
     if args.parallel:
-        print("Running models in parallel...")
-        completed = 0
-        with ProcessPoolExecutor(max_workers=len(models)) as executor:
-            futures = {executor.submit(run_single_model, *task): task[0] for task in tasks}
-
-            for future in as_completed(futures):
-                model = futures[future]
-                completed += 1
+        # Each in-flight model holds a child process; the 2x CPU factor is
+        # safe because children mostly wait on LLM responses, but an
+        # unbounded fan-out over many models would still thrash
+        max_workers = args.max_workers or min(len(models), (os.cpu_count() or 1) * 2)
+        print(f"Running models in parallel (up to {max_workers} at once)...")
+
+        async def run_all() -> list[dict]:
+            """Run every model's benchmark concurrently, printing as each finishes."""
+            limit = asyncio.Semaphore(max_workers)
+
+            async def guarded(task):
+                model, output_file = task
                 try:
-                    result = future.result()
-                    results.append(result)
-
-                    if result['status'] == 'success':
-                        print(f"[{completed}/{len(tasks)}] ✓ {model}: {result['wins']}/{result['runs']} wins "
-                              f"({result['win_rate']*100:.1f}%), "
-                              f"avg turns: {result['avg_turns_when_won']}")
-                    else:
-                        print(f"[{completed}/{len(tasks)}] ✗ {model}: {result['status']} - {result.get('error', 'Unknown error')[:80]}")
-
+                    async with limit:
+                        return await run_bound(model, output_file=output_file)
                 except Exception as e:
-                    print(f"[{completed}/{len(tasks)}] ✗ {model}: Unexpected error - {str(e)[:80]}")
-                    results.append({
-                        'model': model,
-                        'status': 'error',
-                        'error': str(e)
-                    })
+                    return {'model': model, 'status': 'error', 'error': str(e)}
+
+            gathered = []
+            pending = [asyncio.ensure_future(guarded(task)) for task in tasks]
+            for completed, coro in enumerate(asyncio.as_completed(pending), 1):
+                result = await coro
+                gathered.append(result)
+                model = result['model']
+                if result['status'] == 'success':
+                    print(f"[{completed}/{len(tasks)}] ✓ {model}: {result['wins']}/{result['runs']} wins "
+                          f"({result['win_rate']*100:.1f}%), "
+                          f"avg turns: {result['avg_turns_when_won']}")
+                else:
+                    print(f"[{completed}/{len(tasks)}] ✗ {model}: {result['status']} - {result.get('error', 'Unknown error')[:80]}")
+            return gathered
+
+        results.extend(asyncio.run(run_all()))
 
     else:
         print("Running models sequentially...")
-        for i, task in enumerate(tasks, 1):
-            model = task[0]
+        for i, (model, output_file) in enumerate(tasks, 1):
             print(f"[{i}/{len(tasks)}] Testing {model}...")
 
-            result = run_single_model(*task)
+            result = asyncio.run(run_bound(model, output_file=output_file))
             results.append(result)
 
             if result['status'] == 'success':
@@ -348,8 +699,8 @@ Examples:
     }
 
     summary_file = output_dir / f"{batch_name}_summary.json"
-    with open(summary_file, 'w') as f:
-        json.dump(summary, f, indent=2)
+    with open(summary_file, 'wb') as f:
+        f.write(_json.dumps_indented(summary))
 
     # Print final summary
     print("=" * 70)
@@ -1,19 +1,41 @@
 """Utility to purge old result files."""
 
 import argparse
+import fnmatch
+import os
 import sys
-from pathlib import Path
+import time
 from glob import glob
-from datetime import datetime, timedelta
 import shutil
 
 
-def get_file_age(file_path: Path) -> int:
-    """Get file age in days."""
-    mtime = file_path.stat().st_mtime
-    file_date = datetime.fromtimestamp(mtime)
-    age = datetime.now() - file_date
-    return age.days
+def _scan_pattern(pattern: str):
+    """Yield (path, stat) for files matching a single-directory glob.
+
+    os.scandir hands back DirEntry objects whose stat is served from the
+    directory read, so enumeration costs one syscall per directory rather
+    than one lstat per match. Recursive or multi-directory patterns fall
+    back to glob.
+    """
+    dir_part, glob_part = os.path.split(pattern)
+    if any(ch in dir_part for ch in '*?[') or '**' in glob_part:
+        for p in glob(pattern, recursive=True):
+            yield p, os.stat(p)
+        return
+
+    try:
+        it = os.scandir(dir_part or '.')
+    except OSError:
+        return
+    with it:
+        # glob() hides dotfiles unless the pattern itself starts with
+        # one; mirror that so this path never widens a purge's match set
+        hidden_ok = glob_part.startswith('.')
+        for entry in it:
+            if not hidden_ok and entry.name.startswith('.'):
+                continue
+            if entry.is_file() and fnmatch.fnmatch(entry.name, glob_part):
+                yield entry.path, entry.stat()
 
 
 def purge_files(pattern: str, older_than: int = None, archive: bool = False,
@@ -31,44 +53,41 @@ def purge_files(pattern: str, older_than: int = None, archive: bool = False,
     Returns:
         (files_processed, files_skipped) tuple
     """
-    files = glob(pattern)
+    # Stat each file once up front; age, size, and display all read from
+    # the cached result instead of re-statting per phase. Paths stay plain
+    # strings throughout — no Path allocations on the bulk path.
+    now = time.time()
+    entries = list(_scan_pattern(pattern))
 
-    if not files:
+    if not entries:
         print(f"No files found matching pattern: {pattern}")
         return (0, 0)
 
     # Filter by age if specified
     if older_than is not None:
-        filtered_files = []
-        for f_str in files:
-            f = Path(f_str)
-            age = get_file_age(f)
-            if age >= older_than:
-                filtered_files.append(f_str)
-        files = filtered_files
-
-    if not files:
+        entries = [(p, st) for p, st in entries
+                   if (now - st.st_mtime) // 86400 >= older_than]
+
+    if not entries:
         print(f"No files found older than {older_than} days")
         return (0, 0)
 
     # Show files to be processed
-    print(f"Found {len(files)} file(s) to {'archive' if archive else 'delete'}:")
-    for f in files:
-        f_path = Path(f)
-        age = get_file_age(f_path)
-        size = f_path.stat().st_size
-        print(f"  {f_path.name:50s} {size:>10,} bytes, {age} days old")
+    print(f"Found {len(entries)} file(s) to {'archive' if archive else 'delete'}:")
+    for p, st in entries:
+        age_days = int((now - st.st_mtime) // 86400)
+        print(f"  {os.path.basename(p):50s} {st.st_size:>10,} bytes, {age_days} days old")
 
     if dry_run:
         print("\n[DRY RUN] No files were actually modified")
-        return (len(files), 0)
+        return (len(entries), 0)
 
     # Confirm unless forced
     if not force:
-        response = input(f"\n{'Archive' if archive else 'Delete'} these {len(files)} file(s)? [y/N]: ")
+        response = input(f"\n{'Archive' if archive else 'Delete'} these {len(entries)} file(s)? [y/N]: ")
         if response.lower() not in ['y', 'yes']:
             print("Aborted")
-            return (0, len(files))
+            return (0, len(entries))
 
     # Process files
     processed = 0
@@ -76,32 +95,41 @@ def purge_files(pattern: str, older_than: int = None, archive: bool = False,
 
     if archive:
         # Create archive directory
-        archive_dir = Path("outputs/archive")
-        archive_dir.mkdir(parents=True, exist_ok=True)
-
-    for f_str in files:
-        f = Path(f_str)
+        archive_dir = "outputs/archive"
+        os.makedirs(archive_dir, exist_ok=True)
+        # Collision handling works against this in-memory name set, so no
+        # exists() probe per candidate name
+        existing = {e.name for e in os.scandir(archive_dir)}
+        archive_dev = os.stat(archive_dir).st_dev
+
+    for p, st in entries:
+        name = os.path.basename(p)
         try:
             if archive:
-                dest = archive_dir / f.name
                 # Handle name collisions
-                counter = 1
-                while dest.exists():
-                    stem = f.stem
-                    suffix = f.suffix
-                    dest = archive_dir / f"{stem}_{counter}{suffix}"
-                    counter += 1
-
-                shutil.move(str(f), str(dest))
-                print(f"  Archived: {f.name} → {dest}")
+                dest_name = name
+                if dest_name in existing:
+                    stem, suffix = os.path.splitext(name)
+                    counter = 1
+                    while dest_name in existing:
+                        dest_name = f"{stem}_{counter}{suffix}"
+                        counter += 1
+                dest = os.path.join(archive_dir, dest_name)
+                if st.st_dev == archive_dev:
+                    # Same filesystem: one rename syscall
+                    os.replace(p, dest)
+                else:
+                    shutil.move(p, dest)
+                existing.add(dest_name)
+                print(f"  Archived: {name} → {dest}")
             else:
-                f.unlink()
-                print(f"  Deleted: {f.name}")
+                os.remove(p)
+                print(f"  Deleted: {name}")
 
             processed += 1
 
         except Exception as e:
-            print(f"  Error processing {f.name}: {e}", file=sys.stderr)
+            print(f"  Error processing {name}: {e}", file=sys.stderr)
             skipped += 1
 
     return (processed, skipped)
@@ -1,19 +1,216 @@
 """Report generator for Mastermind LLM Benchmark results."""
 
+from __future__ import annotations
+
 import argparse
-import json
+import csv
+import hashlib
+import os
+import string
 import sys
 from pathlib import Path
 from datetime import datetime
 from glob import glob
 from typing import Optional
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib
 from tabulate import tabulate
 
-# Use non-interactive backend for matplotlib
-matplotlib.use('Agg')
+from . import _json
+
+# pandas, numpy, and matplotlib import lazily inside the functions that
+# need them: their combined import time dominates reporter startup, and
+# the streaming csv/terminal paths never touch them
+
+# pyarrow is optional; without it the Parquet result cache is skipped and
+# every report run re-parses the JSONL files
+try:
+    import pyarrow
+    import pyarrow.parquet as _parquet
+    from pyarrow import json as _pa_json
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+def _import_pyplot():
+    """Import pyplot on the non-interactive backend, with renderer
+    features the report charts never use switched off."""
+    import matplotlib
+    matplotlib.use('Agg')
+    matplotlib.rcParams.update({
+        'text.usetex': False,
+        'path.simplify': True,
+        'agg.path.chunksize': 10000,
+        'figure.max_open_warning': 0,
+    })
+    import matplotlib.pyplot as plt
+    return plt
+
+
+# Flattened record layout: column names, plus which columns get categorical
+# and integer dtypes (low-cardinality strings as categoricals make the
+# groupby/filter paths integer-code compares; explicit int64 avoids object
+# columns when a file holds odd values)
+_COLUMNS = ('file', 'model', 'mode', 'outcome', 'total_turns', 'duration_seconds',
+            'secret', 'num_colors', 'num_pegs', 'allow_duplicates', 'max_turns',
+            'timestamp', 'input_tokens', 'output_tokens', 'total_tokens', 'num_turns')
+_CATEGORICAL_COLUMNS = ('file', 'model', 'mode', 'outcome')
+_INT_COLUMNS = ('total_turns', 'num_colors', 'num_pegs',
+                'input_tokens', 'output_tokens', 'total_tokens', 'num_turns')
+
+
+# Above this size, a file is handed to pyarrow's multithreaded JSON reader
+# instead of the line-by-line parser
+_LARGE_FILE_BYTES = 50 * 1024 * 1024
+
+
+def _parse_file_arrow(file_path: str) -> dict[str, list]:
+    """Parse one large JSONL file with pyarrow's multithreaded C++ reader.
+
+    Produces the same per-column lists as the line-by-line parser; the
+    nested llm_config/config/total_tokens structs are flattened from the
+    Arrow table, and the per-game guess count is computed from the turns
+    list column with one bincount.
+    """
+    import numpy as np
+    import pyarrow.compute as pc
+
+    table = _pa_json.read_json(
+        file_path,
+        read_options=_pa_json.ReadOptions(use_threads=True, block_size=8 << 20))
+    n = table.num_rows
+    llm_config = table.column('llm_config').combine_chunks()
+    config = table.column('config').combine_chunks()
+    tokens = table.column('total_tokens').combine_chunks()
+    input_tokens = pc.fill_null(tokens.field('input'), 0)
+    output_tokens = pc.fill_null(tokens.field('output'), 0)
+
+    # Turns that recorded a guess, counted per game
+    turns = table.column('turns').combine_chunks()
+    parent = pc.list_parent_indices(turns).to_numpy()
+    guess_len = pc.fill_null(
+        pc.list_value_length(turns.flatten().field('guess')), 0).to_numpy()
+    num_turns = np.bincount(parent[guess_len > 0], minlength=n).tolist()
+
+    return {
+        'file': [Path(file_path).name] * n,
+        'model': llm_config.field('model').to_pylist(),
+        'mode': llm_config.field('mode').to_pylist(),
+        'outcome': table.column('outcome').to_pylist(),
+        'total_turns': table.column('total_turns').to_pylist(),
+        'duration_seconds': table.column('duration_seconds').to_pylist(),
+        'secret': [str(v) for v in table.column('secret').to_pylist()],
+        'num_colors': config.field('num_colors').to_pylist(),
+        'num_pegs': config.field('num_pegs').to_pylist(),
+        'allow_duplicates': config.field('allow_duplicates').to_pylist(),
+        'max_turns': config.field('max_turns').to_pylist(),
+        'timestamp': table.column('timestamp').to_pylist(),
+        'input_tokens': input_tokens.to_pylist(),
+        'output_tokens': output_tokens.to_pylist(),
+        'total_tokens': pc.add(input_tokens, output_tokens).to_pylist(),
+        'num_turns': num_turns,
+    }
+
+
+def _parse_file(file_path: str) -> dict[str, list]:
+    """Parse one JSONL result file into per-column lists.
+
+    Failures stay local: a malformed file prints a warning and yields
+    empty columns, matching the old per-file try/except.
+    """
+    cols = {name: [] for name in _COLUMNS}
+    file_name = Path(file_path).name
+    try:
+        # Large files go through Arrow's parallel reader; any schema
+        # surprise falls back to the tolerant line-by-line loop below
+        if PYARROW_AVAILABLE and os.path.getsize(file_path) > _LARGE_FILE_BYTES:
+            try:
+                return _parse_file_arrow(file_path)
+            except Exception:
+                pass
+
+        # Binary read feeds raw bytes straight to the JSON parser
+        # (orjson when installed); no per-line str decode or strip
+        with open(file_path, 'rb') as f:
+            for line in f:
+                if not line or line == b'\n':
+                    continue
+                result = _json.loads(line)
+
+                config = result['config']
+                tokens = result['total_tokens']
+                input_tokens = tokens.get('input', 0)
+                output_tokens = tokens.get('output', 0)
+
+                # Counting loop: no temporary list per record
+                num_turns = 0
+                for t in result['turns']:
+                    if t.get('guess'):
+                        num_turns += 1
+
+                cols['file'].append(file_name)
+                cols['model'].append(result['llm_config']['model'])
+                cols['mode'].append(result['llm_config']['mode'])
+                cols['outcome'].append(result['outcome'])
+                cols['total_turns'].append(result['total_turns'])
+                cols['duration_seconds'].append(result['duration_seconds'])
+                cols['secret'].append(str(result['secret']))
+                cols['num_colors'].append(config['num_colors'])
+                cols['num_pegs'].append(config['num_pegs'])
+                cols['allow_duplicates'].append(config['allow_duplicates'])
+                cols['max_turns'].append(config['max_turns'])
+                cols['timestamp'].append(result['timestamp'])
+                cols['input_tokens'].append(input_tokens)
+                cols['output_tokens'].append(output_tokens)
+                cols['total_tokens'].append(input_tokens + output_tokens)
+                cols['num_turns'].append(num_turns)
+
+    except Exception as e:
+        print(f"Warning: Failed to load {file_path}: {e}", file=sys.stderr)
+    return cols
+
+
+# Parsed-column cache, one Parquet file (plus stat metadata) per source file
+_CACHE_DIR = Path('outputs/.cache')
+
+
+def _cache_paths(file_path: str) -> tuple[Path, Path]:
+    """Cache and metadata paths for a source file."""
+    digest = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()
+    return _CACHE_DIR / f'{digest}.parquet', _CACHE_DIR / f'{digest}.meta.json'
+
+
+def _parse_file_cached(file_path: str) -> dict[str, list]:
+    """Parse a file through the Parquet cache.
+
+    Result files are append-once and reports are rerun over the same
+    outputs directory, so parsed columns are cached keyed on the file's
+    (mtime, size); unchanged files load from Parquet instead of
+    re-parsing JSONL. Cache failures fall back to a plain parse.
+    """
+    if not PYARROW_AVAILABLE:
+        return _parse_file(file_path)
+
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return _parse_file(file_path)
+
+    cache_file, meta_file = _cache_paths(file_path)
+    try:
+        meta = _json.loads(meta_file.read_bytes())
+        if meta['mtime'] == st.st_mtime and meta['size'] == st.st_size:
+            return _parquet.read_table(cache_file).to_pydict()
+    except (OSError, ValueError, KeyError):
+        pass
+
+    cols = _parse_file(file_path)
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _parquet.write_table(pyarrow.Table.from_pydict(cols), cache_file)
+        meta_file.write_bytes(
+            _json.dumps_bytes({'mtime': st.st_mtime, 'size': st.st_size}))
+    except Exception:
+        pass
+    return cols
 
 
 def load_results(input_patterns: list[str], filter_model: Optional[str] = None,
@@ -21,6 +218,12 @@ def load_results(input_patterns: list[str], filter_model: Optional[str] = None,
     """
     Load results from JSONL files and return as DataFrame.
 
+    Files parse concurrently on a thread pool — the work is file reads
+    plus orjson parsing, which releases the GIL — and records accumulate
+    in one Python list per column rather than one dict per row, so
+    pd.DataFrame gets ready-made columns instead of re-pivoting (and
+    re-inferring dtypes from) N row dicts.
+
     Args:
         input_patterns: List of glob patterns for input files
         filter_model: Optional model name filter
@@ -29,243 +232,277 @@ def load_results(input_patterns: list[str], filter_model: Optional[str] = None,
     Returns:
         DataFrame with flattened result records
     """
-    records = []
+    import pandas as pd
 
-    for pattern in input_patterns:
-        files = glob(pattern)
-        for file_path in files:
-            try:
-                with open(file_path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        result = json.loads(line)
-
-                        # Flatten result for DataFrame
-                        record = {
-                            'file': Path(file_path).name,
-                            'model': result['llm_config']['model'],
-                            'mode': result['llm_config']['mode'],
-                            'outcome': result['outcome'],
-                            'total_turns': result['total_turns'],
-                            'duration_seconds': result['duration_seconds'],
-                            'secret': str(result['secret']),
-                            'num_colors': result['config']['num_colors'],
-                            'num_pegs': result['config']['num_pegs'],
-                            'allow_duplicates': result['config']['allow_duplicates'],
-                            'max_turns': result['config']['max_turns'],
-                            'timestamp': result['timestamp'],
-                            'input_tokens': result['total_tokens'].get('input', 0),
-                            'output_tokens': result['total_tokens'].get('output', 0),
-                            'total_tokens': (result['total_tokens'].get('input', 0) +
-                                           result['total_tokens'].get('output', 0)),
-                            'num_turns': len([t for t in result['turns'] if t.get('guess')])
-                        }
-
-                        # Apply filters
-                        if filter_model and record['model'] != filter_model:
-                            continue
-                        if filter_outcome and record['outcome'] != filter_outcome:
-                            continue
-
-                        records.append(record)
-
-            except Exception as e:
-                print(f"Warning: Failed to load {file_path}: {e}", file=sys.stderr)
-                continue
-
-    if not records:
-        raise ValueError("No valid result records found")
-
-    return pd.DataFrame(records)
-
-
-def calculate_statistics(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Calculate aggregate statistics per model.
+    all_files = [f for pattern in input_patterns for f in glob(pattern)]
 
-    Returns:
-        DataFrame with columns: model, total_games, wins, losses, errors, win_rate,
-                                avg_turns, avg_duration, total_tokens, avg_tokens_per_game
-    """
-    stats = []
+    if len(all_files) <= 1:
+        chunks = [_parse_file_cached(f) for f in all_files]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(32, len(all_files))) as executor:
+            chunks = list(executor.map(_parse_file_cached, all_files))
 
-    for model in df['model'].unique():
-        model_df = df[df['model'] == model]
+    cols = {name: [] for name in _COLUMNS}
+    for chunk in chunks:
+        for name, values in chunk.items():
+            cols[name].extend(values)
 
-        total_games = len(model_df)
-        wins = len(model_df[model_df['outcome'] == 'win'])
-        losses = len(model_df[model_df['outcome'] == 'loss'])
-        errors = len(model_df[model_df['outcome'] == 'error'])
+    if not cols['model']:
+        raise ValueError("No valid result records found")
 
-        win_rate = wins / total_games if total_games > 0 else 0
+    df = pd.DataFrame(cols)
+    for name in _CATEGORICAL_COLUMNS:
+        df[name] = df[name].astype('category')
+    for name in _INT_COLUMNS:
+        df[name] = df[name].astype('int64')
+    # max_turns is legitimately null for unlimited games, so it gets the
+    # nullable integer dtype instead of a plain int64 cast
+    df['max_turns'] = df['max_turns'].astype('Int64')
+
+    # Filters run as one vectorized mask each (an integer-code compare on
+    # the categorical columns) instead of a Python branch per record
+    if filter_model:
+        df = df[df['model'] == filter_model]
+    if filter_outcome:
+        df = df[df['outcome'] == filter_outcome]
+    if df.empty:
+        raise ValueError("No valid result records found")
+    return df
 
-        # Only calculate turn stats for wins
-        win_df = model_df[model_df['outcome'] == 'win']
-        avg_turns = win_df['total_turns'].mean() if len(win_df) > 0 else 0
-        min_turns = int(win_df['total_turns'].min()) if len(win_df) > 0 else 0
-        max_turns = int(win_df['total_turns'].max()) if len(win_df) > 0 else 0
-        win_turns_list = list(win_df['total_turns'].values) if len(win_df) > 0 else []
 
-        avg_duration = model_df['duration_seconds'].mean()
-        total_tokens = model_df['total_tokens'].sum()
-        avg_tokens = model_df['total_tokens'].mean()
+def _streaming_stats(paths: list[str], filter_model: Optional[str] = None,
+                     filter_outcome: Optional[str] = None) -> list[dict]:
+    """Aggregate per-model statistics straight from the result files.
 
-        stats.append({
+    One pass with O(models) state — no per-game DataFrame — for report
+    formats that only need the summary rows. Produces the same columns,
+    rounding, and win-rate ordering as calculate_statistics.
+    """
+    from collections import defaultdict
+
+    agg = defaultdict(lambda: {'mode': None, 'total_games': 0, 'wins': 0,
+                               'losses': 0, 'errors': 0, 'duration': 0.0,
+                               'tokens': 0, 'win_turns': []})
+    for file_path in paths:
+        try:
+            with open(file_path, 'rb') as f:
+                for line in f:
+                    if not line or line == b'\n':
+                        continue
+                    result = _json.loads(line)
+                    model = result['llm_config']['model']
+                    outcome = result['outcome']
+                    if filter_model and model != filter_model:
+                        continue
+                    if filter_outcome and outcome != filter_outcome:
+                        continue
+                    a = agg[model]
+                    if a['mode'] is None:
+                        a['mode'] = result['llm_config']['mode']
+                    a['total_games'] += 1
+                    if outcome == 'win':
+                        a['wins'] += 1
+                        a['win_turns'].append(result['total_turns'])
+                    elif outcome == 'loss':
+                        a['losses'] += 1
+                    else:
+                        a['errors'] += 1
+                    a['duration'] += result['duration_seconds']
+                    tokens = result['total_tokens']
+                    a['tokens'] += tokens.get('input', 0) + tokens.get('output', 0)
+        except Exception as e:
+            print(f"Warning: Failed to load {file_path}: {e}", file=sys.stderr)
+
+    rows = []
+    for model, a in agg.items():
+        n = a['total_games']
+        wt = a['win_turns']
+        rows.append({
             'model': model,
-            'mode': model_df['mode'].iloc[0],
-            'total_games': total_games,
-            'wins': wins,
-            'losses': losses,
-            'errors': errors,
-            'win_rate': win_rate,
-            'avg_turns_when_won': round(avg_turns, 2),
-            'min_turns': min_turns,
-            'max_turns': max_turns,
-            'win_turns': ', '.join(str(int(t)) for t in win_turns_list) if win_turns_list else '-',
-            'avg_duration': round(avg_duration, 2),
-            'total_tokens': int(total_tokens),
-            'avg_tokens_per_game': round(avg_tokens, 1)
+            'mode': a['mode'],
+            'total_games': n,
+            'wins': a['wins'],
+            'losses': a['losses'],
+            'errors': a['errors'],
+            'win_rate': a['wins'] / n if n else 0,
+            'avg_turns_when_won': round(sum(wt) / len(wt), 2) if wt else 0,
+            'min_turns': min(wt) if wt else 0,
+            'max_turns': max(wt) if wt else 0,
+            'win_turns': ', '.join(map(str, wt)) if wt else '-',
+            'avg_duration': round(a['duration'] / n, 2) if n else 0,
+            'total_tokens': a['tokens'],
+            'avg_tokens_per_game': round(a['tokens'] / n, 1) if n else 0,
         })
+    rows.sort(key=lambda r: r['win_rate'], reverse=True)
+    return rows
 
-    stats_df = pd.DataFrame(stats)
-    stats_df = stats_df.sort_values('win_rate', ascending=False)
-    return stats_df
 
+def calculate_statistics(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calculate aggregate statistics per model.
 
-def generate_html_report(df: pd.DataFrame, stats_df: pd.DataFrame, output_path: Path):
-    """Generate HTML report with visualizations."""
+    Aggregation runs as one groupby over the whole frame plus one over the
+    winning games, instead of re-slicing the DataFrame with boolean masks
+    once per model — a single linear scan regardless of model count.
 
-    # Create figures
-    fig_dir = output_path.parent / f"{output_path.stem}_files"
-    fig_dir.mkdir(exist_ok=True)
+    Returns:
+        DataFrame with columns: model, total_games, wins, losses, errors, win_rate,
+                                avg_turns, avg_duration, total_tokens, avg_tokens_per_game
+    """
+    import numpy as np
+
+    is_win = df['outcome'] == 'win'
+
+    stats_df = (
+        df.assign(is_win=is_win,
+                  is_loss=df['outcome'] == 'loss',
+                  is_error=df['outcome'] == 'error')
+          .groupby('model', observed=True, sort=False)
+          .agg(mode=('mode', 'first'),
+               total_games=('outcome', 'size'),
+               wins=('is_win', 'sum'),
+               losses=('is_loss', 'sum'),
+               errors=('is_error', 'sum'),
+               avg_duration=('duration_seconds', 'mean'),
+               total_tokens=('total_tokens', 'sum'),
+               avg_tokens_per_game=('total_tokens', 'mean'))
+    )
 
-    # Figure 1: Win rate comparison (bar chart)
-    plt.figure(figsize=(10, 6))
-    plt.bar(stats_df['model'], stats_df['win_rate'] * 100, color='steelblue')
-    plt.xlabel('Model')
-    plt.ylabel('Win Rate (%)')
-    plt.title('Win Rate by Model')
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
-    fig1_path = fig_dir / 'win_rate.png'
-    plt.savefig(fig1_path, dpi=100)
-    plt.close()
+    # Turn stats only make sense over winning games
+    win_stats = (
+        df.loc[is_win]
+          .groupby('model', observed=True, sort=False)['total_turns']
+          .agg(avg_turns_when_won='mean', min_turns='min', max_turns='max',
+               # np.char.mod formats the whole group's ints in C
+               win_turns=lambda s: ', '.join(np.char.mod('%d', s.to_numpy())))
+    )
+    stats_df = stats_df.join(win_stats)
+
+    stats_df['win_rate'] = stats_df['wins'] / stats_df['total_games']
+    # Models without a single win have NaN turn stats; match the old
+    # per-model defaults
+    stats_df['avg_turns_when_won'] = stats_df['avg_turns_when_won'].fillna(0).round(2)
+    stats_df['min_turns'] = stats_df['min_turns'].fillna(0).astype(int)
+    stats_df['max_turns'] = stats_df['max_turns'].fillna(0).astype(int)
+    stats_df['win_turns'] = stats_df['win_turns'].fillna('-')
+    stats_df['avg_duration'] = stats_df['avg_duration'].round(2)
+    stats_df['total_tokens'] = stats_df['total_tokens'].astype(int)
+    stats_df['avg_tokens_per_game'] = stats_df['avg_tokens_per_game'].round(1)
+
+    stats_df = stats_df.reset_index()[[
+        'model', 'mode', 'total_games', 'wins', 'losses', 'errors', 'win_rate',
+        'avg_turns_when_won', 'min_turns', 'max_turns', 'win_turns',
+        'avg_duration', 'total_tokens', 'avg_tokens_per_game'
+    ]]
+    return stats_df.sort_values('win_rate', ascending=False)
+
+
+def _figure_hash(*frames) -> str:
+    """Content hash over the DataFrame slices a figure is rendered from."""
+    import pandas as pd
+
+    h = hashlib.sha1()
+    for frame in frames:
+        h.update(pd.util.hash_pandas_object(frame, index=True).values.tobytes())
+    return h.hexdigest()
+
+
+def _figure_current(fig_path: Path, content_hash: str) -> bool:
+    """True when the PNG at fig_path was rendered from identical data."""
+    try:
+        return (fig_path.exists() and
+                fig_path.with_name(fig_path.name + '.hash').read_text() == content_hash)
+    except OSError:
+        return False
 
-    # Figure 2: Turn distribution (box plot)
-    plt.figure(figsize=(10, 6))
-    win_df = df[df['outcome'] == 'win']
-    if len(win_df) > 0:
-        models = win_df['model'].unique()
-        data_to_plot = [win_df[win_df['model'] == m]['total_turns'].values for m in models]
-        plt.boxplot(data_to_plot, tick_labels=models)
-        plt.xlabel('Model')
-        plt.ylabel('Turns to Win')
-        plt.title('Turn Distribution for Winning Games')
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        fig2_path = fig_dir / 'turn_distribution.png'
-        plt.savefig(fig2_path, dpi=100)
-    plt.close()
 
-    # Figure 3: Token efficiency (scatter plot)
-    plt.figure(figsize=(10, 6))
-    win_df = df[df['outcome'] == 'win']
-    if len(win_df) > 0 and win_df['total_tokens'].sum() > 0:
-        for model in win_df['model'].unique():
-            model_wins = win_df[win_df['model'] == model]
-            if len(model_wins) > 0:
-                plt.scatter(model_wins['total_turns'], model_wins['total_tokens'],
-                           label=model, alpha=0.6, s=50)
-        plt.xlabel('Turns to Win')
-        plt.ylabel('Total Tokens Used')
-        plt.title('Token Efficiency (Winning Games)')
-        plt.legend()
-        plt.tight_layout()
-        fig3_path = fig_dir / 'token_efficiency.png'
-        plt.savefig(fig3_path, dpi=100)
-    plt.close()
+def _save_figure(fig, fig_path: Path, content_hash: str) -> None:
+    """Save a figure plus the hash sidecar that lets reruns skip it."""
+    fig.savefig(fig_path, dpi=100)
+    fig_path.with_name(fig_path.name + '.hash').write_text(content_hash)
+
 
-    # Generate HTML
-    html_content = f"""<!DOCTYPE html>
+# HTML report shell, compiled once at import; generate_html_report only
+# substitutes the handful of dynamic values
+_HTML_HEAD = string.Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Mastermind LLM Benchmark Report</title>
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
             max-width: 1200px;
             margin: 0 auto;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        h1, h2 {{
+        }
+        h1, h2 {
             color: #333;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 30px;
             border-radius: 10px;
             margin-bottom: 30px;
-        }}
-        .section {{
+        }
+        .section {
             background: white;
             padding: 20px;
             margin-bottom: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 20px 0;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 12px;
             text-align: left;
             border-bottom: 1px solid #ddd;
-        }}
-        th {{
+        }
+        th {
             background-color: #667eea;
             color: white;
             font-weight: 600;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background-color: #f5f5f5;
-        }}
-        .metric {{
+        }
+        .metric {
             display: inline-block;
             margin: 10px 20px 10px 0;
-        }}
-        .metric-label {{
+        }
+        .metric-label {
             color: #666;
             font-size: 0.9em;
-        }}
-        .metric-value {{
+        }
+        .metric-value {
             font-size: 1.5em;
             font-weight: bold;
             color: #667eea;
-        }}
-        img {{
+        }
+        img {
             max-width: 100%;
             height: auto;
             border-radius: 8px;
             margin: 20px 0;
-        }}
-        .win {{ color: #28a745; }}
-        .loss {{ color: #dc3545; }}
-        .error {{ color: #ffc107; }}
+        }
+        .win { color: #28a745; }
+        .loss { color: #dc3545; }
+        .error { color: #ffc107; }
     </style>
 </head>
 <body>
     <div class="header">
         <h1>Mastermind LLM Benchmark Report</h1>
-        <p>Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-        <p>Total Games: {len(df)} | Models Tested: {len(stats_df)}</p>
+        <p>Generated: $generated</p>
+        <p>Total Games: $total_games | Models Tested: $models_tested</p>
     </div>
 
     <div class="section">
@@ -286,118 +523,199 @@ def generate_html_report(df: pd.DataFrame, stats_df: pd.DataFrame, output_path:
                 </tr>
             </thead>
             <tbody>
-"""
-
-    for _, row in stats_df.iterrows():
-        html_content += f"""                <tr>
-                    <td><strong>{row['model']}</strong></td>
-                    <td>{row['mode']}</td>
-                    <td>{row['total_games']}</td>
-                    <td class="win">{row['wins']}</td>
-                    <td class="loss">{row['losses']}</td>
-                    <td class="error">{row['errors']}</td>
-                    <td>{row['win_rate']*100:.1f}%</td>
-                    <td>{row['avg_turns_when_won']:.1f}</td>
-                    <td>{row['avg_duration']:.2f}</td>
-                    <td>{row['total_tokens']:,}</td>
-                </tr>
-"""
+""")
 
-    html_content += """            </tbody>
+_HTML_TAIL = string.Template("""            </tbody>
         </table>
     </div>
 
     <div class="section">
         <h2>Win Rate Comparison</h2>
-        <img src="{stem}_files/win_rate.png" alt="Win Rate">
+        <img src="${stem}_files/win_rate.png" alt="Win Rate">
     </div>
 
     <div class="section">
         <h2>Turn Distribution (Winning Games)</h2>
-        <img src="{stem}_files/turn_distribution.png" alt="Turn Distribution">
+        <img src="${stem}_files/turn_distribution.png" alt="Turn Distribution">
     </div>
 
     <div class="section">
         <h2>Token Efficiency (Winning Games)</h2>
-        <img src="{stem}_files/token_efficiency.png" alt="Token Efficiency">
+        <img src="${stem}_files/token_efficiency.png" alt="Token Efficiency">
     </div>
 
     <div class="section">
         <h2>Overall Metrics</h2>
         <div class="metric">
             <div class="metric-label">Total Games</div>
-            <div class="metric-value">{total_games}</div>
+            <div class="metric-value">$total_games</div>
         </div>
         <div class="metric">
             <div class="metric-label">Total Wins</div>
-            <div class="metric-value">{total_wins}</div>
+            <div class="metric-value">$total_wins</div>
         </div>
         <div class="metric">
             <div class="metric-label">Overall Win Rate</div>
-            <div class="metric-value">{win_rate:.1f}%</div>
+            <div class="metric-value">$win_rate%</div>
         </div>
     </div>
 </body>
 </html>
-""".format(
-    stem=output_path.stem,
-    total_games=len(df),
-    total_wins=stats_df['wins'].sum(),
-    win_rate=stats_df['win_rate'].mean() * 100
-)
+""")
+
+
+def _row_html(r) -> str:
+    """Render one summary-table row from a stats namedtuple."""
+    return f"""                <tr>
+                    <td><strong>{r.model}</strong></td>
+                    <td>{r.mode}</td>
+                    <td>{r.total_games}</td>
+                    <td class="win">{r.wins}</td>
+                    <td class="loss">{r.losses}</td>
+                    <td class="error">{r.errors}</td>
+                    <td>{r.win_rate*100:.1f}%</td>
+                    <td>{r.avg_turns_when_won:.1f}</td>
+                    <td>{r.avg_duration:.2f}</td>
+                    <td>{r.total_tokens:,}</td>
+                </tr>
+"""
+
+
+def generate_html_report(df: pd.DataFrame, stats_df: pd.DataFrame,
+                         metrics: dict, output_path: Path):
+    """Generate HTML report with visualizations.
+
+    Each chart carries a content-hash sidecar; when the data it renders
+    from is unchanged since the last run, the existing PNG is kept and
+    the matplotlib work (the expensive part of HTML generation) is
+    skipped. The three charts also share one reused figure.
+    """
+
+    # Create figures
+    fig_dir = output_path.parent / f"{output_path.stem}_files"
+    fig_dir.mkdir(exist_ok=True)
+
+    plt = _import_pyplot()
+    win_df = df[df['outcome'] == 'win']
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # Figure 1: Win rate comparison (bar chart)
+    fig1_path = fig_dir / 'win_rate.png'
+    fig1_hash = _figure_hash(stats_df[['model', 'win_rate']])
+    if not _figure_current(fig1_path, fig1_hash):
+        ax.clear()
+        ax.bar(stats_df['model'], stats_df['win_rate'] * 100, color='steelblue')
+        ax.set_xlabel('Model')
+        ax.set_ylabel('Win Rate (%)')
+        ax.set_title('Win Rate by Model')
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        fig.tight_layout()
+        _save_figure(fig, fig1_path, fig1_hash)
+
+    # Figure 2: Turn distribution (box plot)
+    if len(win_df) > 0:
+        fig2_path = fig_dir / 'turn_distribution.png'
+        fig2_hash = _figure_hash(win_df[['model', 'total_turns']])
+        if not _figure_current(fig2_path, fig2_hash):
+            ax.clear()
+            models = win_df['model'].unique()
+            data_to_plot = [win_df[win_df['model'] == m]['total_turns'].values for m in models]
+            ax.boxplot(data_to_plot, tick_labels=models)
+            ax.set_xlabel('Model')
+            ax.set_ylabel('Turns to Win')
+            ax.set_title('Turn Distribution for Winning Games')
+            plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+            fig.tight_layout()
+            _save_figure(fig, fig2_path, fig2_hash)
+
+    # Figure 3: Token efficiency (scatter plot)
+    if len(win_df) > 0 and win_df['total_tokens'].sum() > 0:
+        fig3_path = fig_dir / 'token_efficiency.png'
+        fig3_hash = _figure_hash(win_df[['model', 'total_turns', 'total_tokens']])
+        if not _figure_current(fig3_path, fig3_hash):
+            ax.clear()
+            for model in win_df['model'].unique():
+                model_wins = win_df[win_df['model'] == model]
+                if len(model_wins) > 0:
+                    ax.scatter(model_wins['total_turns'], model_wins['total_tokens'],
+                               label=model, alpha=0.6, s=50)
+            ax.set_xlabel('Turns to Win')
+            ax.set_ylabel('Total Tokens Used')
+            ax.set_title('Token Efficiency (Winning Games)')
+            ax.legend()
+            fig.tight_layout()
+            _save_figure(fig, fig3_path, fig3_hash)
+
+    plt.close(fig)
+
+    # Generate HTML, streamed to disk: fixed head, one write per table
+    # row, then the tail — the report never sits fully in memory
+    html_head = _HTML_HEAD.substitute(
+        generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        total_games=metrics['total_games'],
+        models_tested=metrics['models_tested'])
+
+    html_tail = _HTML_TAIL.substitute(
+        stem=output_path.stem,
+        total_games=metrics['total_games'],
+        total_wins=metrics['total_wins'],
+        win_rate=f"{metrics['overall_win_rate'] * 100:.1f}")
 
     with open(output_path, 'w') as f:
-        f.write(html_content)
+        f.write(html_head)
+        f.writelines(_row_html(r) for r in stats_df.itertuples(index=False))
+        f.write(html_tail)
 
     print(f"HTML report saved to: {output_path}")
     print(f"Supporting files in: {fig_dir}")
 
 
-def generate_markdown_report(df: pd.DataFrame, stats_df: pd.DataFrame, output_path: Path):
-    """Generate Markdown report."""
-
-    md_content = f"""# Mastermind LLM Benchmark Report
+def _model_markdown(r) -> str:
+    """Render one per-model breakdown section from a stats namedtuple."""
+    return f"""### {r.model} ({r.mode} mode)
 
-**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-**Total Games:** {len(df)}
-**Models Tested:** {len(stats_df)}
-
-## Summary Statistics
+- **Games:** {r.total_games}
+- **Wins:** {r.wins} ({r.win_rate*100:.1f}%)
+- **Losses:** {r.losses}
+- **Errors:** {r.errors}
+- **Average Turns (when won):** {r.avg_turns_when_won:.1f}
+- **Average Duration:** {r.avg_duration:.2f}s
+- **Total Tokens:** {r.total_tokens:,}
 
 """
 
-    # Convert stats to markdown table
-    md_content += stats_df.to_markdown(index=False)
 
-    md_content += f"""
+def generate_markdown_report(df: pd.DataFrame, stats_df: pd.DataFrame,
+                             metrics: dict, output_path: Path):
+    """Generate Markdown report."""
 
-## Overall Metrics
+    # Streamed to disk chunk by chunk; to_markdown renders the summary
+    # table straight into the file handle
+    with open(output_path, 'w') as f:
+        f.write(f"""# Mastermind LLM Benchmark Report
 
-- **Total Games:** {len(df)}
-- **Total Wins:** {stats_df['wins'].sum()}
-- **Total Losses:** {stats_df['losses'].sum()}
-- **Total Errors:** {stats_df['errors'].sum()}
-- **Overall Win Rate:** {stats_df['win_rate'].mean() * 100:.1f}%
+**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+**Total Games:** {metrics['total_games']}
+**Models Tested:** {metrics['models_tested']}
 
-## Per-Model Breakdown
+## Summary Statistics
 
-"""
+""")
+        stats_df.to_markdown(buf=f, index=False)
+        f.write(f"""
 
-    for _, row in stats_df.iterrows():
-        md_content += f"""### {row['model']} ({row['mode']} mode)
+## Overall Metrics
 
-- **Games:** {row['total_games']}
-- **Wins:** {row['wins']} ({row['win_rate']*100:.1f}%)
-- **Losses:** {row['losses']}
-- **Errors:** {row['errors']}
-- **Average Turns (when won):** {row['avg_turns_when_won']:.1f}
-- **Average Duration:** {row['avg_duration']:.2f}s
-- **Total Tokens:** {row['total_tokens']:,}
+- **Total Games:** {metrics['total_games']}
+- **Total Wins:** {metrics['total_wins']}
+- **Total Losses:** {metrics['total_losses']}
+- **Total Errors:** {metrics['total_errors']}
+- **Overall Win Rate:** {metrics['overall_win_rate'] * 100:.1f}%
 
-"""
+## Per-Model Breakdown
 
-    with open(output_path, 'w') as f:
-        f.write(md_content)
+""")
+        f.writelines(_model_markdown(r) for r in stats_df.itertuples(index=False))
 
     print(f"Markdown report saved to: {output_path}")
 
@@ -408,42 +726,50 @@ def generate_csv_report(stats_df: pd.DataFrame, output_path: Path):
     print(f"CSV report saved to: {output_path}")
 
 
-def generate_terminal_report(df: pd.DataFrame, stats_df: pd.DataFrame):
-    """Print report to terminal."""
-
+def _print_terminal_report(table_data: list[list], total_games: int,
+                           models_tested: int, overall_win_rate: float):
+    """Print the formatted terminal report from prepared table rows."""
     print("\n" + "=" * 100)
     print("MASTERMIND LLM BENCHMARK REPORT")
     print("=" * 100)
     print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Total Games: {len(df)} | Models Tested: {len(stats_df)}")
+    print(f"Total Games: {total_games} | Models Tested: {models_tested}")
     print("=" * 100)
 
     print("\nSUMMARY STATISTICS")
     print("-" * 100)
 
-    # Format table for terminal
-    table_data = []
-    for _, row in stats_df.iterrows():
-        table_data.append([
-            row['model'],
-            row['total_games'],
-            row['wins'],
-            row['losses'],
-            f"{row['win_rate']*100:.1f}%",
-            f"{row['avg_turns_when_won']:.1f}" if row['wins'] > 0 else '-',
-            f"{row['min_turns']}-{row['max_turns']}" if row['wins'] > 0 else '-',
-            row['win_turns'] if row['wins'] > 0 else '-',
-        ])
-
     headers = ['Model', 'Games', 'Wins', 'Losses', 'Win Rate', 'Avg Turns', 'Min-Max', 'Win Turns']
 
     print(tabulate(table_data, headers=headers, tablefmt='grid'))
 
     print("\n" + "=" * 100)
-    print(f"Overall Win Rate: {stats_df['win_rate'].mean() * 100:.1f}%")
+    print(f"Overall Win Rate: {overall_win_rate * 100:.1f}%")
     print("=" * 100 + "\n")
 
 
+def generate_terminal_report(df: pd.DataFrame, stats_df: pd.DataFrame,
+                             metrics: dict):
+    """Print report to terminal."""
+
+    # Format table for terminal: one columnar extraction instead of a
+    # Series per row via iterrows
+    arr = stats_df[['model', 'total_games', 'wins', 'losses', 'win_rate',
+                    'avg_turns_when_won', 'min_turns', 'max_turns',
+                    'win_turns']].to_numpy()
+    table_data = [
+        [row[0], row[1], row[2], row[3],
+         f"{row[4]*100:.1f}%",
+         f"{row[5]:.1f}" if row[2] > 0 else '-',
+         f"{row[6]}-{row[7]}" if row[2] > 0 else '-',
+         row[8] if row[2] > 0 else '-']
+        for row in arr
+    ]
+
+    _print_terminal_report(table_data, metrics['total_games'],
+                           metrics['models_tested'], metrics['overall_win_rate'])
+
+
 def main():
     """Main reporter entry point."""
     parser = argparse.ArgumentParser(
@@ -504,6 +830,39 @@ Examples:
     output_path = Path(output_basename)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # The csv and terminal formats only need the per-model summary rows:
+    # stream the aggregates from the files and never import pandas or
+    # build the per-game DataFrame
+    if set(formats) <= {'csv', 'terminal'}:
+        all_files = [f for pattern in args.input for f in glob(pattern)]
+        rows = _streaming_stats(all_files, args.filter_model, args.filter_outcome)
+        if not rows:
+            print("Error: No valid result records found", file=sys.stderr)
+            sys.exit(1)
+        if 'csv' in formats:
+            csv_path = output_path.with_suffix('.csv')
+            with open(csv_path, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+            print(f"CSV report saved to: {csv_path}")
+        if 'terminal' in formats:
+            table_data = [
+                [r['model'], r['total_games'], r['wins'], r['losses'],
+                 f"{r['win_rate']*100:.1f}%",
+                 f"{r['avg_turns_when_won']:.1f}" if r['wins'] > 0 else '-',
+                 f"{r['min_turns']}-{r['max_turns']}" if r['wins'] > 0 else '-',
+                 r['win_turns'] if r['wins'] > 0 else '-']
+                for r in rows
+            ]
+            _print_terminal_report(
+                table_data,
+                total_games=sum(r['total_games'] for r in rows),
+                models_tested=len(rows),
+                overall_win_rate=sum(r['win_rate'] for r in rows) / len(rows))
+        print("\nReport generation complete!")
+        return
+
     # Load results
     try:
         df = load_results(args.input, args.filter_model, args.filter_outcome)
@@ -513,19 +872,28 @@ Examples:
 
     print(f"Loaded {len(df)} result(s) from {len(df['file'].unique())} file(s)")
 
-    # Calculate statistics
+    # Calculate statistics, plus the overall scalars every generator
+    # shows, reduced once here instead of per report format
     stats_df = calculate_statistics(df)
+    metrics = {
+        'total_games': len(df),
+        'models_tested': len(stats_df),
+        'total_wins': int(stats_df['wins'].sum()),
+        'total_losses': int(stats_df['losses'].sum()),
+        'total_errors': int(stats_df['errors'].sum()),
+        'overall_win_rate': float(stats_df['win_rate'].mean()),
+    }
 
     # Generate reports
     for fmt in formats:
         if fmt == 'html':
-            generate_html_report(df, stats_df, output_path.with_suffix('.html'))
+            generate_html_report(df, stats_df, metrics, output_path.with_suffix('.html'))
         elif fmt == 'markdown':
-            generate_markdown_report(df, stats_df, output_path.with_suffix('.md'))
+            generate_markdown_report(df, stats_df, metrics, output_path.with_suffix('.md'))
         elif fmt == 'csv':
             generate_csv_report(stats_df, output_path.with_suffix('.csv'))
         elif fmt == 'terminal':
-            generate_terminal_report(df, stats_df)
+            generate_terminal_report(df, stats_df, metrics)
 
     print("\nReport generation complete!")
 
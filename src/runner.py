@@ -1,14 +1,11 @@
 """Game session management and result tracking."""
 
 from dataclasses import dataclass, asdict
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 import time
 
 from .game import GameConfig, MastermindGame
-from .llm_player import LLMPlayer
-from .clipboard_player import ClipboardPlayer
-from .cli_player import CLIPlayer
 
 
 @dataclass
@@ -52,7 +49,10 @@ class GameSession:
 
     def run(self) -> GameResult:
         """Run a complete game and return results."""
-        start_time = time.time()
+        # Monotonic clock for the timeout/duration math (immune to wall
+        # clock jumps); one wall-clock read just for the result timestamp
+        start_mono = time.monotonic()
+        start_wall = time.time()
         game = MastermindGame(self.game_config, secret=self.predefined_secret)
 
         turns = []
@@ -63,8 +63,7 @@ class GameSession:
         try:
             while not game.is_game_over():
                 # Check timeout
-                elapsed = time.time() - start_time
-                if elapsed > self.timeout_seconds:
+                if time.monotonic() - start_mono > self.timeout_seconds:
                     outcome = "error"
                     turns.append({"error": f"Game timeout after {self.timeout_seconds}s (safety limit)"})
                     break
@@ -100,7 +99,7 @@ class GameSession:
             outcome = "error"
             turns.append({"error": f"Fatal error: {str(e)}"})
 
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_mono
 
         return GameResult(
             config=asdict(self.game_config),
@@ -109,7 +108,8 @@ class GameSession:
             turns=turns,
             outcome=outcome,
             total_turns=game.turns_taken,
-            timestamp=datetime.utcnow().isoformat() + "Z",
+            timestamp=datetime.fromtimestamp(
+                start_wall, tz=timezone.utc).isoformat().replace('+00:00', 'Z'),
             duration_seconds=round(duration, 2),
             total_tokens=total_tokens
         )
@@ -174,8 +174,12 @@ class GameSession:
         raise RuntimeError("Retry logic error")
 
     def _get_player_config(self) -> dict:
-        """Get player configuration as dict."""
-        if isinstance(self.player, LLMPlayer):
+        """Get player configuration as dict.
+
+        Duck-typed on the player's config attribute so the player modules
+        (and their heavy dependencies) only load when a mode is used.
+        """
+        if hasattr(self.player, 'llm_config'):
             return {
                 "mode": "api",
                 "model": self.player.llm_config.model,
@@ -184,7 +188,7 @@ class GameSession:
                 "use_parser_fallback": self.player.llm_config.use_parser_fallback,
                 "parser_model": self.player.llm_config.parser_model if self.player.llm_config.use_parser_fallback else None
             }
-        elif isinstance(self.player, CLIPlayer):
+        elif hasattr(self.player, 'cli_config'):
             return {
                 "mode": "cli",
                 "model": f"{self.player.cli_config.cli_tool}-cli",